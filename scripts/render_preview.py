@@ -20,6 +20,11 @@ if str(SRC) not in sys.path:
 
 from analog_image_generator import preview
 
+try:  # Optional fast path; the stdlib parser is used when orjson is absent.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the local environment
+    orjson = None
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
@@ -53,6 +58,12 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Do not persist mask rasters (still tracked in metadata)",
     )
+    parser.add_argument(
+        "--mask-dtype",
+        choices=preview.MASK_DTYPES,
+        default="uint8",
+        help="Raster dtype for mask PNGs (uint8 quantized, float32 for scientific runs)",
+    )
     return parser.parse_args()
 
 
@@ -61,7 +72,7 @@ def main() -> None:
 
     params: dict[str, Any] | None = None
     if args.params_file:
-        params = json.loads(args.params_file.read_text())
+        params = _load_json(args.params_file)
     if args.style:
         if params is None:
             params = {}
@@ -73,17 +84,16 @@ def main() -> None:
         height=args.height,
         seed=args.seed,
         params=params,
+        generate_masks=not args.skip_masks,
     )
 
-    if args.skip_masks:
-        masks = {}
-
     artifacts = preview.save_preview(
         analog,
         masks,
         metadata,
         output_dir=args.output_dir,
         slug=args.slug,
+        mask_dtype=args.mask_dtype,
     )
 
     summary = {
@@ -93,7 +103,19 @@ def main() -> None:
         "metadata": str(artifacts.metadata_path),
         "mask_count": len(artifacts.mask_paths),
     }
-    print(json.dumps(summary, indent=2))
+    print(_dump_json(summary))
+
+
+def _load_json(path: Path) -> Any:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text())
+
+
+def _dump_json(payload: dict[str, Any]) -> str:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(payload, indent=2)
 
 
 if __name__ == "__main__":
@@ -8,6 +8,8 @@ a lightweight CI hook before committing larger runs.
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Iterable
 
@@ -31,26 +33,46 @@ STACKED_MASKS: tuple[str, ...] = (
     "package_id_map",
 )
 
-
-def _run_smoke(style: str) -> dict:
+SMOKE_STYLES: tuple[str, ...] = ("meandering", "braided", "anastomosing")
+
+
+@dataclass(slots=True)
+class SmokeRow:
+    """Reporting row for one smoke realization (mirrors ``reporting.CSV_COLUMNS``)."""
+
+    env: str
+    realization_id: str
+    seed: int
+    beta_iso: float
+    beta_seg1: float
+    beta_seg2: float
+    h0: float
+    entropy_global: float
+    fractal_dimension: float
+    psd_aspect: float
+    psd_theta: float
+    topology_channel_area_fraction: float
+    topology_channel_compactness: float
+    topology_channel_component_count: float
+    topology_channel_largest_component_ratio: float
+    qa_psd_anisotropy_warning: bool
+    qa_channel_area_warning: bool
+    gray: np.ndarray
+    color: np.ndarray
+    petrology_cement: str = ""
+    petrology_mineralogy: dict = field(default_factory=dict)
+    stacked_package_count: int = 0
+
+
+def _run_smoke(style: str) -> SmokeRow:
     params = {"style": style, "seed": 123, "height": 128, "width": 128}
     analog, masks = gg.generate_fluvial(params)
     assert analog.shape == (128, 128)
     _assert_required_masks(masks, REQUIRED_MASKS)
-    metrics = stats.compute_metrics(analog, masks, "fluvial")
-    _assert_metric_keys(metrics)
-    metrics["env"] = "fluvial"
-    metrics["realization_id"] = f"{style}-seed123"
-    metrics["seed"] = 123
-    metrics["gray"] = analog
-    metrics["color"] = _sample_color_stack(masks, analog.shape)
-    metrics.setdefault("petrology_cement", "")
-    metrics.setdefault("petrology_mineralogy", {})
-    metrics.setdefault("stacked_package_count", 0)
-    return metrics
+    return _metrics_row(analog, masks, realization_id=f"{style}-seed123", seed=123)
 
 
-def _run_stacked_smoke() -> dict:
+def _run_stacked_smoke() -> SmokeRow:
     params = {
         "mode": "stacked",
         "package_count": 2,
@@ -65,18 +87,25 @@ def _run_stacked_smoke() -> dict:
     _assert_required_masks(masks, REQUIRED_MASKS + STACKED_MASKS)
     meta = masks["realization_metadata"]
     assert "stacked_packages" in meta
+    row = _metrics_row(analog, masks, realization_id="stacked-seed999", seed=999)
+    assert row.stacked_package_count == params["package_count"]
+    return row
+
+
+def _metrics_row(
+    analog: np.ndarray, masks: dict, *, realization_id: str, seed: int
+) -> SmokeRow:
+    """Compute metrics once and attach the reporting fields for a smoke realization."""
+
     metrics = stats.compute_metrics(analog, masks, "fluvial")
     _assert_metric_keys(metrics)
     metrics["env"] = "fluvial"
-    metrics["realization_id"] = "stacked-seed999"
-    metrics["seed"] = 999
+    metrics["realization_id"] = realization_id
+    metrics["seed"] = seed
     metrics["gray"] = analog
     metrics["color"] = _sample_color_stack(masks, analog.shape)
-    metrics.setdefault("petrology_cement", "")
-    metrics.setdefault("petrology_mineralogy", {})
-    count = masks.get("package_id_map")
-    metrics["stacked_package_count"] = int(masks["realization_metadata"]["stacked_packages"]["stack_statistics"]["package_count"]) if "realization_metadata" in masks else 0
-    return metrics
+    # compute_metrics already reads the package count from stacked realization metadata.
+    return SmokeRow(**{f.name: metrics[f.name] for f in fields(SmokeRow) if f.name in metrics})
 
 
 def _assert_required_masks(masks: dict, keys: Iterable[str]) -> None:
@@ -96,22 +125,24 @@ def _assert_metric_keys(metrics: dict) -> None:
 
 
 def _sample_color_stack(masks: dict, shape: tuple[int, int]) -> np.ndarray:
-    palette = np.zeros(shape + (3,), dtype=np.float32)
+    zero = np.zeros(shape, dtype=np.float32)
     channel = masks.get("channel")
     if channel is None:
-        channel = np.zeros(shape, dtype=np.float32)
-    palette[..., 0] = channel
-    palette[..., 1] = 0.5 * channel
-    return palette
+        channel = zero
+    return np.stack((channel, 0.5 * channel, zero), axis=-1).astype(np.float32, copy=False)
 
 
 def main() -> int:
-    rows = []
-    for style in ("meandering", "braided", "anastomosing"):
-        rows.append(_run_smoke(style))
-        print(f"✓ smoke passed for style={style}")
-    rows.append(_run_stacked_smoke())
-    print("✓ smoke passed for stacked=2-packages")
+    # Each realization is seeded independently, so the runs can execute side by side.
+    with ProcessPoolExecutor(max_workers=len(SMOKE_STYLES) + 1) as pool:
+        style_futures = [pool.submit(_run_smoke, style) for style in SMOKE_STYLES]
+        stacked_future = pool.submit(_run_stacked_smoke)
+        rows = []
+        for style, future in zip(SMOKE_STYLES, style_futures):
+            rows.append(future.result())
+            print(f"✓ smoke passed for style={style}")
+        rows.append(stacked_future.result())
+        print("✓ smoke passed for stacked=2-packages")
     reporting.build_reports(rows, Path("outputs/smoke_report"))
     print("✓ reporting artifacts generated in outputs/smoke_report")
     return 0
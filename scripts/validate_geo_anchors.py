@@ -4,8 +4,12 @@
 from __future__ import annotations
 
 import importlib
+import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable
 
@@ -14,58 +18,111 @@ from nbformat import validator
 
 ROOT = Path(__file__).resolve().parents[1]
 DOC = ROOT / "docs" / "GEOLOGIC_RULES.md"
+CACHE_PATH = ROOT / ".cache" / "geo_anchors_ids.json"
+
+NotebookCache = dict[str, tuple[int, int, set[str]]]
 
 
 def _load_notebook_ids() -> dict[str, set[str]]:
-    ids: dict[str, set[str]] = {}
-    for nb_path in (ROOT / "notebooks").glob("*.ipynb"):
-        nb = nbformat.read(nb_path, as_version=4)
-        validator.normalize(nb)
-        anchors = {
-            cell.get("metadata", {}).get("id")
-            for cell in nb.get("cells", [])
-            if isinstance(cell, dict)
-        }
-        ids[str(nb_path.resolve())] = {anchor for anchor in anchors if anchor}
-    return ids
+    cache = _read_id_cache()
+    fresh: NotebookCache = {}
+    stale: list[tuple[str, Path, int, int]] = []
+    for nb_path in sorted((ROOT / "notebooks").glob("*.ipynb")):
+        key = str(nb_path.resolve())
+        stat = nb_path.stat()
+        cached = cache.get(key)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            fresh[key] = cached
+        else:
+            stale.append((key, nb_path, stat.st_mtime_ns, stat.st_size))
+    if stale:
+        paths = [nb_path for _, nb_path, _, _ in stale]
+        if len(paths) > 1:
+            # Notebook parsing is CPU-bound JSON work, so spread it over processes.
+            with ProcessPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as pool:
+                parsed = list(pool.map(_parse_notebook_ids, paths))
+        else:
+            parsed = [_parse_notebook_ids(paths[0])]
+        for (key, _, mtime_ns, size), anchors in zip(stale, parsed):
+            fresh[key] = (mtime_ns, size, anchors)
+    if fresh != cache:
+        _write_id_cache(fresh)
+    return {key: entry[2] for key, entry in fresh.items()}
+
+
+def _parse_notebook_ids(nb_path: Path) -> set[str]:
+    nb = nbformat.read(nb_path, as_version=4)
+    validator.normalize(nb)
+    anchors = {
+        cell.get("metadata", {}).get("id")
+        for cell in nb.get("cells", [])
+        if isinstance(cell, dict)
+    }
+    return {anchor for anchor in anchors if anchor}
+
+
+def _read_id_cache() -> NotebookCache:
+    # Stored as {path: [mtime_ns, size, ids]}; anything malformed is simply a cache miss.
+    try:
+        raw = json.loads(CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(raw, dict):
+        return {}
+    cache: NotebookCache = {}
+    for key, entry in raw.items():
+        if not (isinstance(entry, list) and len(entry) == 3):
+            continue
+        mtime_ns, size, ids = entry
+        if (
+            type(mtime_ns) is int
+            and type(size) is int
+            and isinstance(ids, list)
+            and all(isinstance(anchor, str) for anchor in ids)
+        ):
+            cache[key] = (mtime_ns, size, set(ids))
+    return cache
+
+
+def _write_id_cache(cache: NotebookCache) -> None:
+    payload = {key: [mtime_ns, size, sorted(ids)] for key, (mtime_ns, size, ids) in cache.items()}
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        CACHE_PATH.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+    except OSError:  # pragma: no cover - read-only checkouts still validate
+        pass
 
 
 TARGET_ENVS = {"Meandering", "Braided", "Anastomosing", "Stacked", "Fluvial", "All"}
 
+TOKEN_RE = re.compile(r"`([^`]+)`")
+ANCHOR_SPLIT_RE = re.compile(r"\s+/\s+")
+
 
 def _parse_geo_rows() -> list[tuple[list[str], list[str]]]:
     rows: list[tuple[list[str], list[str]]] = []
-    pattern = re.compile(r"`([^`]+)`")
-    with DOC.open() as fh:
-        for line in fh:
-            if "analog_image_generator." not in line:
-                continue
-            parts = [part.strip() for part in line.strip().split("|")]
-            if len(parts) < 4 or parts[0] not in TARGET_ENVS:
-                continue
-            matches = pattern.findall(line)
-            if len(matches) < 2:
-                continue
-            code_tokens = matches[:-1]
-            notebook_token = matches[-1]
-            code_anchors = [part.strip() for part in " / ".join(code_tokens).split(" / ")]
-            notebook_entries = []
-            for entry in notebook_token.split(" / "):
-                entry = entry.strip()
-                if "#" not in entry:
-                    continue
-                notebook_rel = entry.split("#", 1)[0]
-                if not (ROOT / notebook_rel).exists():
-                    continue
-                notebook_entries.append(entry)
-            if not notebook_entries:
-                continue
-            rows.append(
-                (
-                    [entry for entry in code_anchors if entry],
-                    notebook_entries,
-                )
-            )
+    for line in DOC.read_text().splitlines():
+        if "analog_image_generator." not in line:
+            continue
+        parts = line.split("|")
+        if len(parts) < 4 or parts[0].strip() not in TARGET_ENVS:
+            continue
+        # Backtick tokens are taken from the whole line, so a `|` inside a signature still
+        # counts; the last token is the notebook column.
+        tokens = TOKEN_RE.findall(line)
+        if len(tokens) < 2:
+            continue
+        code_anchors = [
+            anchor for token in tokens[:-1] for anchor in ANCHOR_SPLIT_RE.split(token) if anchor
+        ]
+        notebook_entries = [
+            entry
+            for entry in ANCHOR_SPLIT_RE.split(tokens[-1].strip())
+            if "#" in entry and (ROOT / entry.split("#", 1)[0]).exists()
+        ]
+        if not notebook_entries:
+            continue
+        rows.append((code_anchors, notebook_entries))
     return rows
 
 
@@ -79,6 +136,11 @@ def _check_callable(anchor: str) -> str | None:
         module_name, attr_name = func_path.rsplit(".", 1)
     except ValueError:
         return f"Unable to parse anchor: {anchor}"
+    return _resolve_callable(module_name, attr_name)
+
+
+@lru_cache(maxsize=None)
+def _resolve_callable(module_name: str, attr_name: str) -> str | None:
     try:
         module = importlib.import_module(module_name)
     except ImportError as exc:  # pragma: no cover
@@ -88,23 +150,33 @@ def _check_callable(anchor: str) -> str | None:
     return None
 
 
-def _check_notebook_anchor(entry: str, notebook_ids: dict[str, set[str]]) -> str | None:
+def _notebook_ids_by_rel(notebook_ids: dict[str, set[str]]) -> dict[str, frozenset[str]]:
+    # GEOLOGIC_RULES cites notebooks by repo-relative POSIX path; frozen so checks can be cached.
+    return {
+        Path(path).relative_to(ROOT).as_posix(): frozenset(ids)
+        for path, ids in notebook_ids.items()
+    }
+
+
+def _check_notebook_anchor(entry: str, ids_by_rel: dict[str, frozenset[str]]) -> str | None:
     if "#" not in entry:
         return f"Notebook anchor missing '#': {entry}"
+    notebook_rel = entry.split("#", 1)[0]
+    return _check_anchor_cached(entry, ids_by_rel.get(Path(notebook_rel).as_posix()))
+
+
+@lru_cache(maxsize=4096)
+def _check_anchor_cached(entry: str, notebook_anchors: frozenset[str] | None) -> str | None:
     notebook_rel, anchor = entry.split("#", 1)
-    notebook_file = (ROOT / notebook_rel)
-    if not notebook_file.exists():
-        return None
-    notebook_path = str(notebook_file.resolve())
-    if notebook_path not in notebook_ids:
+    if notebook_anchors is None:
         return f"Notebook {notebook_rel} not found for anchor {entry}"
-    if anchor not in notebook_ids[notebook_path]:
+    if anchor not in notebook_anchors:
         return f"Anchor id {anchor} missing in {notebook_rel}"
     return None
 
 
 def main() -> int:
-    notebook_ids = _load_notebook_ids()
+    ids_by_rel = _notebook_ids_by_rel(_load_notebook_ids())
     rows = _parse_geo_rows()
     issues: list[str] = []
     for code_anchors, notebook_entries in rows:
@@ -113,7 +185,7 @@ def main() -> int:
             if err:
                 issues.append(err)
         for entry in notebook_entries:
-            err = _check_notebook_anchor(entry, notebook_ids)
+            err = _check_notebook_anchor(entry, ids_by_rel)
             if err:
                 issues.append(err)
     if issues:
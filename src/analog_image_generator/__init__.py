@@ -1,8 +1,6 @@
 """Public package interface for analog_image_generator."""
 
-from importlib import metadata
-
-from . import preview
+from importlib import import_module, metadata
 
 __all__ = ["__version__", "preview"]
 
@@ -11,3 +9,12 @@ try:
     __version__ = metadata.version("analog-image-generator")
 except metadata.PackageNotFoundError:  # pragma: no cover - during local dev
     __version__ = "0.0.0"
+
+
+def __getattr__(name: str):
+    # ``preview`` pulls in numpy/scipy and the generator stack; load it on first access.
+    if name == "preview":
+        module = import_module(f"{__name__}.preview")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
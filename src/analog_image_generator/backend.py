@@ -0,0 +1,80 @@
+"""Array backend selection (NumPy by default, optional CuPy for batch synthesis).
+
+The generators are written against NumPy/SciPy. Only the FFT- and filter-heavy helpers in
+``utils`` dispatch through this module, so a CUDA device can take the full-grid work while
+every public function keeps returning host ``numpy`` arrays.
+
+Select the backend with ``set_backend("cupy")`` or the ``ANALOG_IMAGE_BACKEND`` environment
+variable; an explicit request for CuPy raises when it is not installed.
+"""
+
+from __future__ import annotations
+
+import os
+from types import ModuleType
+from typing import Any, Literal
+
+import numpy as np
+from scipy import fft as sp_fft
+from scipy import ndimage as sp_ndimage
+
+try:  # Optional GPU backend; NumPy/SciPy stay the reference implementation.
+    import cupy
+    from cupyx.scipy import fft as cupy_fft
+    from cupyx.scipy import ndimage as cupy_ndimage
+except ImportError:  # pragma: no cover - depends on the local environment
+    cupy = None
+    cupy_fft = None
+    cupy_ndimage = None
+
+BackendName = Literal["numpy", "cupy"]
+BACKENDS: tuple[BackendName, ...] = ("numpy", "cupy")
+
+_active: BackendName = "numpy"
+
+
+def set_backend(name: str) -> BackendName:
+    """Activate ``name`` (``"numpy"`` or ``"cupy"``) for subsequent helper calls."""
+
+    global _active
+    key = name.strip().lower()
+    if key not in BACKENDS:
+        raise ValueError(f"backend must be one of {BACKENDS}, got {name!r}")
+    if key == "cupy" and cupy is None:
+        raise RuntimeError("backend 'cupy' requested but cupy is not installed")
+    _active = key  # type: ignore[assignment]
+    return _active
+
+
+def active_backend() -> BackendName:
+    """Return the name of the currently active backend."""
+
+    return _active
+
+
+def namespaces() -> tuple[ModuleType, ModuleType, ModuleType]:
+    """Return ``(xp, fft, ndimage)`` modules for the active backend."""
+
+    if _active == "cupy":
+        return cupy, cupy_fft, cupy_ndimage
+    return np, sp_fft, sp_ndimage
+
+
+def to_device(array: Any) -> Any:
+    """Move ``array`` onto the active backend (no-op for NumPy)."""
+
+    if _active == "cupy":
+        return cupy.asarray(array)
+    return array
+
+
+def to_host(array: Any) -> np.ndarray:
+    """Return ``array`` as a host ``numpy`` array."""
+
+    if cupy is not None and isinstance(array, cupy.ndarray):
+        return cupy.asnumpy(array)
+    return np.asarray(array)
+
+
+if os.environ.get("ANALOG_IMAGE_BACKEND"):
+    set_backend(os.environ["ANALOG_IMAGE_BACKEND"])
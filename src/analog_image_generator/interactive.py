@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import json
 from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
+from hashlib import blake2b
 from pathlib import Path
-from typing import Iterable, Literal, Mapping, Sequence, TypedDict
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Iterable, Literal, Mapping, Sequence, TypedDict
 
-import ipywidgets as ipw
 import numpy as np
 
-from . import geologic_generators, stats, utils
+from . import __version__, geologic_generators, stats, utils
+
+if TYPE_CHECKING:  # Annotations only; the runtime import is deferred to ``_ipw``.
+    import ipywidgets as ipw
 
 EnvKey = Literal["fluvial"]
 SliderType = Literal["float", "int"]
@@ -66,380 +72,368 @@ class PreviewResult:
     layout: ipw.VBox
     frames: list[PreviewFrame]
 
-
-_FLUVIAL_SLIDER_LIBRARY: "OrderedDict[str, SliderGroup]" = OrderedDict(
-    [
-        (
-            "general",
-            {
-                "label": "General (fluvial)",
-                "sliders": OrderedDict(
-                    [
-                        (
-                            "height",
-                            {
-                                "key": "height",
-                                "label": "Height (px)",
-                                "min": 128,
-                                "max": 768,
-                                "step": 32,
-                                "default": 384,
-                                "units": "px",
-                                "source": "PRD fluvial layout defaults",
-                                "citation_ids": ["prd-fluvial-table1"],
-                                "dtype": "int",
-                                "description": "Grid height. Lower for faster previews.",
-                            },
-                        ),
-                        (
-                            "width",
-                            {
-                                "key": "width",
-                                "label": "Width (px)",
-                                "min": 128,
-                                "max": 768,
-                                "step": 32,
-                                "default": 384,
-                                "units": "px",
-                                "source": "PRD fluvial layout defaults",
-                                "citation_ids": ["prd-fluvial-table1"],
-                                "dtype": "int",
-                                "description": "Grid width. Matches height when square belts are desired.",
-                            },
-                        ),
-                        (
-                            "floodplain_noise",
-                            {
-                                "key": "floodplain_noise",
-                                "label": "Floodplain noise",
-                                "min": 0.02,
-                                "max": 0.25,
-                                "step": 0.01,
-                                "default": 0.08,
-                                "units": "σ",
-                                "source": "Nicholas & Fisher 2023 table 2",
-                                "citation_ids": ["research-fluvial-noise"],
-                                "dtype": "float",
-                                "description": "Gaussian noise amplitude for background floodplain texture.",
-                            },
-                        ),
-                    ]
-                ),
+    @property
+    def metrics_soa(self) -> np.ndarray:
+        """Per-seed metrics as a structured array: a ``seed`` column plus one per metric."""
+
+        names = list(self.frames[0]["metrics"]) if self.frames else []
+        dtype = np.dtype([("seed", np.int64)] + [(name, np.float64) for name in names])
+        table = np.empty(len(self.frames), dtype=dtype)
+        table["seed"] = [frame["seed"] for frame in self.frames]
+        for name in names:
+            table[name] = [frame["metrics"][name] for frame in self.frames]
+        return table
+
+
+_FLUVIAL_SLIDER_LIBRARY: dict[str, SliderGroup] = {
+    "general": {
+        "label": "General (fluvial)",
+        "sliders": {
+            "height": {
+                "key": "height",
+                "label": "Height (px)",
+                "min": 128,
+                "max": 768,
+                "step": 32,
+                "default": 384,
+                "units": "px",
+                "source": "PRD fluvial layout defaults",
+                "citation_ids": ["prd-fluvial-table1"],
+                "dtype": "int",
+                "description": "Grid height. Lower for faster previews.",
             },
-        ),
-        (
-            "meandering",
-            {
-                "label": "Meandering controls",
-                "sliders": OrderedDict(
-                    [
-                        (
-                            "n_control_points",
-                            {
-                                "key": "n_control_points",
-                                "label": "Centerline control points",
-                                "min": 3,
-                                "max": 12,
-                                "step": 1,
-                                "default": 6,
-                                "units": "count",
-                                "source": "AGENTS.md fluvial mandates",
-                                "citation_ids": ["prd-fluvial-table1"],
-                                "dtype": "int",
-                                "description": "Number of centerline control points used when solving the spline.",
-                            },
-                        ),
-                        (
-                            "amplitude_min",
-                            {
-                                "key": "amplitude_min",
-                                "label": "Amplitude min (fraction of width)",
-                                "min": 0.05,
-                                "max": 0.2,
-                                "step": 0.01,
-                                "default": 0.08,
-                                "units": "W",
-                                "source": "Leopold & Wolman sinuosity bounds",
-                                "citation_ids": ["research-meander-amp"],
-                                "dtype": "float",
-                                "description": "Lower bound for the random amplitude range controlling belt wiggle.",
-                            },
-                        ),
-                        (
-                            "amplitude_max",
-                            {
-                                "key": "amplitude_max",
-                                "label": "Amplitude max (fraction of width)",
-                                "min": 0.15,
-                                "max": 0.35,
-                                "step": 0.01,
-                                "default": 0.22,
-                                "units": "W",
-                                "source": "Leopold & Wolman sinuosity bounds",
-                                "citation_ids": ["research-meander-amp"],
-                                "dtype": "float",
-                                "description": "Upper bound for the amplitude range.",
-                            },
-                        ),
-                        (
-                            "channel_width_min",
-                            {
-                                "key": "channel_width_min",
-                                "label": "Channel width min (px)",
-                                "min": 12,
-                                "max": 48,
-                                "step": 2,
-                                "default": 26,
-                                "units": "px",
-                                "source": "Bridge 2003 fluvial width summary",
-                                "citation_ids": ["research-meander-width"],
-                                "dtype": "int",
-                                "description": "Lower bound for bankfull width along the belt.",
-                            },
-                        ),
-                        (
-                            "channel_width_max",
-                            {
-                                "key": "channel_width_max",
-                                "label": "Channel width max (px)",
-                                "min": 24,
-                                "max": 72,
-                                "step": 2,
-                                "default": 46,
-                                "units": "px",
-                                "source": "Bridge 2003 fluvial width summary",
-                                "citation_ids": ["research-meander-width"],
-                                "dtype": "int",
-                                "description": "Upper bound for the variable bankfull width curve.",
-                            },
-                        ),
-                        (
-                            "drift_fraction",
-                            {
-                                "key": "drift_fraction",
-                                "label": "Centerline drift fraction",
-                                "min": 0.02,
-                                "max": 0.25,
-                                "step": 0.01,
-                                "default": 0.08,
-                                "units": "fraction",
-                                "source": "Task Master PRD table (fluvial)",
-                                "citation_ids": ["prd-fluvial-table1"],
-                                "dtype": "float",
-                                "description": "Controls the amount of random walk applied to the spline.",
-                            },
-                        ),
-                    ]
-                ),
+            "width": {
+                "key": "width",
+                "label": "Width (px)",
+                "min": 128,
+                "max": 768,
+                "step": 32,
+                "default": 384,
+                "units": "px",
+                "source": "PRD fluvial layout defaults",
+                "citation_ids": ["prd-fluvial-table1"],
+                "dtype": "int",
+                "description": "Grid width. Matches height when square belts are desired.",
             },
-        ),
-        (
-            "braided",
-            {
-                "label": "Braided controls",
-                "sliders": OrderedDict(
-                    [
-                        (
-                            "thread_count",
-                            {
-                                "key": "thread_count",
-                                "label": "Thread count",
-                                "min": 2,
-                                "max": 10,
-                                "step": 1,
-                                "default": 5,
-                                "units": "count",
-                                "source": "Brice 1964 multi-thread observations",
-                                "citation_ids": ["research-braided-thread"],
-                                "dtype": "int",
-                                "description": "Number of active threads in the braid plain.",
-                            },
-                        ),
-                        (
-                            "mean_thread_width",
-                            {
-                                "key": "mean_thread_width",
-                                "label": "Mean thread width (px)",
-                                "min": 10,
-                                "max": 40,
-                                "step": 2,
-                                "default": 18,
-                                "units": "px",
-                                "source": "Brice 1964 multi-thread observations",
-                                "citation_ids": ["research-braided-thread"],
-                                "dtype": "int",
-                                "description": "Nominal width for each braided thread.",
-                            },
-                        ),
-                        (
-                            "bar_spacing_factor",
-                            {
-                                "key": "bar_spacing_factor",
-                                "label": "Bar spacing factor",
-                                "min": 2.0,
-                                "max": 6.0,
-                                "step": 0.2,
-                                "default": 4.2,
-                                "units": "×width",
-                                "source": "Church & Jones 1982 bar spacing ratio",
-                                "citation_ids": ["research-braided-bar"],
-                                "dtype": "float",
-                                "description": "Spacing multiplier between compound bars.",
-                            },
-                        ),
-                    ]
-                ),
+            "floodplain_noise": {
+                "key": "floodplain_noise",
+                "label": "Floodplain noise",
+                "min": 0.02,
+                "max": 0.25,
+                "step": 0.01,
+                "default": 0.08,
+                "units": "σ",
+                "source": "Nicholas & Fisher 2023 table 2",
+                "citation_ids": ["research-fluvial-noise"],
+                "dtype": "float",
+                "description": "Gaussian noise amplitude for background floodplain texture.",
+            },
+        },
+    },
+    "meandering": {
+        "label": "Meandering controls",
+        "sliders": {
+            "n_control_points": {
+                "key": "n_control_points",
+                "label": "Centerline control points",
+                "min": 3,
+                "max": 12,
+                "step": 1,
+                "default": 6,
+                "units": "count",
+                "source": "AGENTS.md fluvial mandates",
+                "citation_ids": ["prd-fluvial-table1"],
+                "dtype": "int",
+                "description": "Number of centerline control points used when solving the spline.",
             },
-        ),
-        (
-            "anastomosing",
-            {
-                "label": "Anastomosing controls",
-                "sliders": OrderedDict(
-                    [
-                        (
-                            "branch_count",
-                            {
-                                "key": "branch_count",
-                                "label": "Branch count",
-                                "min": 2,
-                                "max": 6,
-                                "step": 1,
-                                "default": 3,
-                                "units": "count",
-                                "source": "Makaske 2001 marsh-dominated belts",
-                                "citation_ids": ["research-anasto-branch"],
-                                "dtype": "int",
-                                "description": "Number of active anabranches.",
-                            },
-                        ),
-                        (
-                            "levee_width_px",
-                            {
-                                "key": "levee_width_px",
-                                "label": "Levee width (px)",
-                                "min": 3,
-                                "max": 12,
-                                "step": 1,
-                                "default": 6,
-                                "units": "px",
-                                "source": "Makaske 2001 marsh-dominated belts",
-                                "citation_ids": ["research-anasto-levee"],
-                                "dtype": "int",
-                                "description": "Morphologic levee width for narrow channels.",
-                            },
-                        ),
-                        (
-                            "marsh_fraction",
-                            {
-                                "key": "marsh_fraction",
-                                "label": "Marsh fraction",
-                                "min": 0.1,
-                                "max": 0.75,
-                                "step": 0.05,
-                                "default": 0.45,
-                                "units": "fraction",
-                                "source": "Makaske 2001 marsh-dominated belts",
-                                "citation_ids": ["research-anasto-marsh"],
-                                "dtype": "float",
-                                "description": "Fraction of floodplain treated as wetland marsh.",
-                            },
-                        ),
-                    ]
+            "amplitude_min": {
+                "key": "amplitude_min",
+                "label": "Amplitude min (fraction of width)",
+                "min": 0.05,
+                "max": 0.2,
+                "step": 0.01,
+                "default": 0.08,
+                "units": "W",
+                "source": "Leopold & Wolman sinuosity bounds",
+                "citation_ids": ["research-meander-amp"],
+                "dtype": "float",
+                "description": (
+                    "Lower bound for the random amplitude range controlling belt wiggle."
                 ),
             },
-        ),
-        (
-            "stacked",
-            {
-                "label": "Stacked package controls",
-                "sliders": OrderedDict(
-                    [
-                        (
-                            "package_count",
-                            {
-                                "key": "package_count",
-                                "label": "Package count",
-                                "min": 1,
-                                "max": 5,
-                                "step": 1,
-                                "default": 2,
-                                "units": "count",
-                                "source": "AGENTS stacked channel mandate",
-                                "citation_ids": ["agents-stacked"],
-                                "dtype": "int",
-                                "description": "Number of vertically stacked packages to assemble.",
-                            },
-                        ),
-                        (
-                            "package_relief_px",
-                            {
-                                "key": "package_relief_px",
-                                "label": "Relief per package (px)",
-                                "min": 4,
-                                "max": 64,
-                                "step": 2,
-                                "default": 18,
-                                "units": "px",
-                                "source": "AGENTS stacked channel mandate",
-                                "citation_ids": ["agents-stacked"],
-                                "dtype": "int",
-                                "description": "Erosional relief applied when stacking belts.",
-                            },
-                        ),
-                        (
-                            "package_erosion_depth_px",
-                            {
-                                "key": "package_erosion_depth_px",
-                                "label": "Erosion depth (px)",
-                                "min": 2,
-                                "max": 48,
-                                "step": 2,
-                                "default": 12,
-                                "units": "px",
-                                "source": "AGENTS stacked channel mandate",
-                                "citation_ids": ["agents-stacked"],
-                                "dtype": "int",
-                                "description": "Depth removed from the previous package before depositing the next.",
-                            },
-                        ),
-                    ]
+            "amplitude_max": {
+                "key": "amplitude_max",
+                "label": "Amplitude max (fraction of width)",
+                "min": 0.15,
+                "max": 0.35,
+                "step": 0.01,
+                "default": 0.22,
+                "units": "W",
+                "source": "Leopold & Wolman sinuosity bounds",
+                "citation_ids": ["research-meander-amp"],
+                "dtype": "float",
+                "description": "Upper bound for the amplitude range.",
+            },
+            "channel_width_min": {
+                "key": "channel_width_min",
+                "label": "Channel width min (px)",
+                "min": 12,
+                "max": 48,
+                "step": 2,
+                "default": 26,
+                "units": "px",
+                "source": "Bridge 2003 fluvial width summary",
+                "citation_ids": ["research-meander-width"],
+                "dtype": "int",
+                "description": "Lower bound for bankfull width along the belt.",
+            },
+            "channel_width_max": {
+                "key": "channel_width_max",
+                "label": "Channel width max (px)",
+                "min": 24,
+                "max": 72,
+                "step": 2,
+                "default": 46,
+                "units": "px",
+                "source": "Bridge 2003 fluvial width summary",
+                "citation_ids": ["research-meander-width"],
+                "dtype": "int",
+                "description": "Upper bound for the variable bankfull width curve.",
+            },
+            "drift_fraction": {
+                "key": "drift_fraction",
+                "label": "Centerline drift fraction",
+                "min": 0.02,
+                "max": 0.25,
+                "step": 0.01,
+                "default": 0.08,
+                "units": "fraction",
+                "source": "Task Master PRD table (fluvial)",
+                "citation_ids": ["prd-fluvial-table1"],
+                "dtype": "float",
+                "description": "Controls the amount of random walk applied to the spline.",
+            },
+        },
+    },
+    "braided": {
+        "label": "Braided controls",
+        "sliders": {
+            "thread_count": {
+                "key": "thread_count",
+                "label": "Thread count",
+                "min": 2,
+                "max": 10,
+                "step": 1,
+                "default": 5,
+                "units": "count",
+                "source": "Brice 1964 multi-thread observations",
+                "citation_ids": ["research-braided-thread"],
+                "dtype": "int",
+                "description": "Number of active threads in the braid plain.",
+            },
+            "mean_thread_width": {
+                "key": "mean_thread_width",
+                "label": "Mean thread width (px)",
+                "min": 10,
+                "max": 40,
+                "step": 2,
+                "default": 18,
+                "units": "px",
+                "source": "Brice 1964 multi-thread observations",
+                "citation_ids": ["research-braided-thread"],
+                "dtype": "int",
+                "description": "Nominal width for each braided thread.",
+            },
+            "bar_spacing_factor": {
+                "key": "bar_spacing_factor",
+                "label": "Bar spacing factor",
+                "min": 2.0,
+                "max": 6.0,
+                "step": 0.2,
+                "default": 4.2,
+                "units": "×width",
+                "source": "Church & Jones 1982 bar spacing ratio",
+                "citation_ids": ["research-braided-bar"],
+                "dtype": "float",
+                "description": "Spacing multiplier between compound bars.",
+            },
+        },
+    },
+    "anastomosing": {
+        "label": "Anastomosing controls",
+        "sliders": {
+            "branch_count": {
+                "key": "branch_count",
+                "label": "Branch count",
+                "min": 2,
+                "max": 6,
+                "step": 1,
+                "default": 3,
+                "units": "count",
+                "source": "Makaske 2001 marsh-dominated belts",
+                "citation_ids": ["research-anasto-branch"],
+                "dtype": "int",
+                "description": "Number of active anabranches.",
+            },
+            "levee_width_px": {
+                "key": "levee_width_px",
+                "label": "Levee width (px)",
+                "min": 3,
+                "max": 12,
+                "step": 1,
+                "default": 6,
+                "units": "px",
+                "source": "Makaske 2001 marsh-dominated belts",
+                "citation_ids": ["research-anasto-levee"],
+                "dtype": "int",
+                "description": "Morphologic levee width for narrow channels.",
+            },
+            "marsh_fraction": {
+                "key": "marsh_fraction",
+                "label": "Marsh fraction",
+                "min": 0.1,
+                "max": 0.75,
+                "step": 0.05,
+                "default": 0.45,
+                "units": "fraction",
+                "source": "Makaske 2001 marsh-dominated belts",
+                "citation_ids": ["research-anasto-marsh"],
+                "dtype": "float",
+                "description": "Fraction of floodplain treated as wetland marsh.",
+            },
+        },
+    },
+    "stacked": {
+        "label": "Stacked package controls",
+        "sliders": {
+            "package_count": {
+                "key": "package_count",
+                "label": "Package count",
+                "min": 1,
+                "max": 5,
+                "step": 1,
+                "default": 2,
+                "units": "count",
+                "source": "AGENTS stacked channel mandate",
+                "citation_ids": ["agents-stacked"],
+                "dtype": "int",
+                "description": "Number of vertically stacked packages to assemble.",
+            },
+            "package_relief_px": {
+                "key": "package_relief_px",
+                "label": "Relief per package (px)",
+                "min": 4,
+                "max": 64,
+                "step": 2,
+                "default": 18,
+                "units": "px",
+                "source": "AGENTS stacked channel mandate",
+                "citation_ids": ["agents-stacked"],
+                "dtype": "int",
+                "description": "Erosional relief applied when stacking belts.",
+            },
+            "package_erosion_depth_px": {
+                "key": "package_erosion_depth_px",
+                "label": "Erosion depth (px)",
+                "min": 2,
+                "max": 48,
+                "step": 2,
+                "default": 12,
+                "units": "px",
+                "source": "AGENTS stacked channel mandate",
+                "citation_ids": ["agents-stacked"],
+                "dtype": "int",
+                "description": (
+                    "Depth removed from the previous package before depositing the next."
                 ),
             },
-        ),
-    ]
+        },
+    },
+}
+
+_FACIES_TO_MASK: Mapping[str, str] = MappingProxyType(
+    {
+        "channel": "channel",
+        "pointbar": "scroll_bar",
+        "levee": "levee",
+        "floodplain": "floodplain",
+        "oxbow": "oxbow",
+        "thread": "channel",
+        "bar": "bar",
+        "chute": "chute",
+        "marsh": "marsh",
+    }
 )
 
-_FACIES_TO_MASK = {
-    "channel": "channel",
-    "pointbar": "scroll_bar",
-    "levee": "levee",
-    "floodplain": "floodplain",
-    "oxbow": "oxbow",
-    "thread": "channel",
-    "bar": "bar",
-    "chute": "chute",
-    "marsh": "marsh",
-}
+# Fluvial palette resolved once at import: the mask key each entry reads and its RGB row.
+_FLUVIAL_PALETTE = utils.palette_for_env("fluvial")
+_FLUVIAL_MASK_KEYS = tuple(
+    _FACIES_TO_MASK.get(entry["facies"], entry["facies"]) for entry in _FLUVIAL_PALETTE
+)
+_FLUVIAL_COLORS = utils.palette_colors(_FLUVIAL_PALETTE)
+_FLUVIAL_COLORS.setflags(write=False)
 
-_PACKAGE_STYLE_OPTIONS = ("meandering", "braided", "anastomosing")
+_PACKAGE_STYLE_OPTIONS: tuple[str, ...] = ("meandering", "braided", "anastomosing")
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _clone_slider_library(library: Mapping[str, SliderGroup]) -> dict[str, SliderGroup]:
+    # Rebuilds only the mutable containers (group/slider dicts and citation lists); leaves are
+    # immutable scalars/strings, so this matches deepcopy without its memo/reduce overhead.
+    return {
+        group_key: {
+            **group,
+            "sliders": {
+                slider_key: {**config, "citation_ids": list(config["citation_ids"])}
+                for slider_key, config in group["sliders"].items()
+            },
+        }
+        for group_key, group in library.items()
+    }
+
+
+_SLIDER_SOURCES: dict[str, dict[str, SliderGroup]] = {"fluvial": _FLUVIAL_SLIDER_LIBRARY}
+
+# Immutable views built once at import; read-only callers share them instead of deep copies.
+_SLIDER_LIBRARIES: Mapping[str, Mapping[str, SliderGroup]] = MappingProxyType(
+    {env: _freeze(library) for env, library in _SLIDER_SOURCES.items()}
+)
+
+
+def slider_library(env: str) -> Mapping[str, SliderGroup]:
+    """Return the shared read-only slider definitions for *env* (task anchor: UX sliders).
+
+    Use :func:`build_sliders` when the definitions need to be edited.
+    """
+
+    library = _SLIDER_LIBRARIES.get(env.strip().lower())
+    if library is None:
+        raise NotImplementedError("Interactive sliders currently available for fluvial env only.")
+    return library
 
 
 def build_sliders(env: str) -> dict[str, SliderGroup]:
     """Return slider definitions for *env* (task anchor: UX sliders)."""
 
-    env_key = env.strip().lower()
-    if env_key != "fluvial":
+    source = _SLIDER_SOURCES.get(env.strip().lower())
+    if source is None:
         raise NotImplementedError("Interactive sliders currently available for fluvial env only.")
-    # Defensive copy so notebooks/tests can tweak defaults without mutating module state.
-    import copy
-
-    return copy.deepcopy(_FLUVIAL_SLIDER_LIBRARY)
+    # Defensive copy so notebooks/tests can tweak defaults without mutating module state; not
+    # memoised, since a cached dict would leak one caller's edits into the next.
+    return _clone_slider_library(source)
 
 
 def build_interactive_ui(env: str) -> InteractivePanel:
     """Create an ipywidgets-based control panel for *env*."""
 
+    ipw = _ipw()
     slider_groups = build_sliders(env)
     slider_widgets: dict[str, ipw.Widget] = {}
     slider_children: list[ipw.Widget] = []
@@ -525,24 +519,47 @@ def slider_state(panel: InteractivePanel) -> dict[str, float]:
         if key in panel.widgets:
             params[key] = panel.widgets[key].value
     return params
-def preview_sequence(env: str, params: Mapping[str, float] | None, seeds: Iterable[int]) -> PreviewResult:
-    """Return a widget layout that stacks preview frames for each seed."""
+def preview_sequence(
+    env: str,
+    params: Mapping[str, float] | None,
+    seeds: Iterable[int] | np.ndarray,
+    *,
+    n_jobs: int = 1,
+) -> PreviewResult:
+    """Return a widget layout that stacks preview frames for each seed.
+
+    ``n_jobs > 1`` generates the realizations in worker processes via
+    ``geologic_generators.generate_fluvial_batch``; frames are identical either way.
+    """
 
+    ipw = _ipw()
     env_key = env.strip().lower()
     generator = _resolve_generator(env_key)
     params = dict(params or {})
-    seeds = list(seeds)
+    seed_values = np.fromiter(seeds, dtype=np.int64)
     frames: list[PreviewFrame] = []
     rows: list[ipw.Widget] = []
     height = int(params.get("height", 256))
     width = int(params.get("width", 256))
-
-    for seed in seeds:
-        merged_params = dict(params)
-        merged_params.setdefault("style", "meandering")
-        merged_params["seed"] = int(seed)
-        analog, masks = generator(merged_params)
-        color = _colorize_masks(env_key, masks, analog.shape)
+    # Each frame is encoded to PNG before the next seed runs, so one RGB buffer and one facies
+    # stack serve all seeds.
+    color_buffer: np.ndarray | None = None
+    mask_scratch: np.ndarray | None = None
+    params.setdefault("style", "meandering")
+    seed_params = [{**params, "seed": seed} for seed in seed_values.tolist()]
+    if n_jobs > 1 and len(seed_params) > 1:
+        results = iter(geologic_generators.generate_fluvial_batch(seed_params, n_jobs=n_jobs))
+    else:
+        results = (generator(merged) for merged in seed_params)
+
+    for merged_params, (analog, masks) in zip(seed_params, results):
+        seed = merged_params["seed"]
+        if color_buffer is None or color_buffer.shape[:2] != analog.shape:
+            color_buffer = np.empty((*analog.shape, 3), dtype=np.float32)
+            mask_scratch = np.empty((len(_FLUVIAL_MASK_KEYS), *analog.shape), dtype=np.float32)
+        color = _colorize_masks(
+            env_key, masks, analog.shape, out=color_buffer, scratch=mask_scratch
+        )
         channel = masks.get("channel")
         if channel is None:
             channel = masks.get("branch_channel")
@@ -566,8 +583,18 @@ def run_param_batch(
     style: str = "meandering",
     mode: str = "single",
     extra_params: Mapping[str, float] | None = None,
+    n_jobs: int = 1,
+    cache_arrays: bool = False,
 ) -> list[dict]:
-    """Render a batch of realizations for the supplied seeds and write PNGs."""
+    """Render a batch of realizations for the supplied seeds and write PNGs.
+
+    ``n_jobs > 1`` generates the realizations in worker processes, as in
+    :func:`preview_sequence`; the written files do not depend on it. With
+    ``cache_arrays=True`` each realization's arrays are also kept as ``<slug>.npz`` plus a
+    ``<slug>.json`` digest of the params, package version and cache format; later runs with
+    the same digest reload them instead of regenerating. Generator edits that do not bump
+    the version are not detected, so clear ``output_dir`` after changing them locally.
+    """
 
     env_key = env.strip().lower()
     if not seeds:
@@ -578,24 +605,89 @@ def run_param_batch(
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    for seed in seeds:
-        params = dict(defaults)
-        params.update(extra_params or {})
-        params["seed"] = int(seed)
-        params["style"] = style
-        params["mode"] = mode
-        analog, masks = generator(params)
-        color = _colorize_masks(env_key, masks, analog.shape)
-        slug = f"{env_key}-{style}-{seed:03d}"
+    batch_params = [
+        {**defaults, **(extra_params or {}), "seed": int(seed), "style": style, "mode": mode}
+        for seed in seeds
+    ]
+    slugs = [f"{env_key}-{style}-{seed:03d}" for seed in seeds]
+    cached: dict[int, tuple[np.ndarray, dict[str, np.ndarray]]] = {}
+    if cache_arrays:
+        for idx, (slug, params) in enumerate(zip(slugs, batch_params)):
+            hit = _load_cached_realization(output_path / slug, params)
+            if hit is not None:
+                cached[idx] = hit
+    pending = [params for idx, params in enumerate(batch_params) if idx not in cached]
+    if n_jobs > 1 and len(pending) > 1:
+        generated = iter(geologic_generators.generate_fluvial_batch(pending, n_jobs=n_jobs))
+    else:
+        generated = (generator(params) for params in pending)
+
+    color_buffer: np.ndarray | None = None
+    mask_scratch: np.ndarray | None = None
+    for idx, (seed, slug) in enumerate(zip(seeds, slugs)):
+        if idx in cached:
+            analog, masks = cached.pop(idx)
+        else:
+            analog, masks = next(generated)
+            if cache_arrays:
+                _store_cached_realization(output_path / slug, batch_params[idx], analog, masks)
+        if color_buffer is None or color_buffer.shape[:2] != analog.shape:
+            color_buffer = np.empty((*analog.shape, 3), dtype=np.float32)
+            mask_scratch = np.empty((len(_FLUVIAL_MASK_KEYS), *analog.shape), dtype=np.float32)
+        color = _colorize_masks(
+            env_key, masks, analog.shape, out=color_buffer, scratch=mask_scratch
+        )
         analog_path = output_path / f"{slug}-gray.png"
         color_path = output_path / f"{slug}-color.png"
-        _save_png(analog, analog_path, cmap="gray")
-        _save_png(color, color_path, cmap=None)
+        utils.save_png(analog, analog_path, cmap="gray")
+        utils.save_png(color, color_path, cmap=None)
         saved.append({"seed": int(seed), "analog": analog_path, "color": color_path})
     return saved
 
 
+# Bump when the npz layout changes; together with the package version it invalidates old
+# cached realizations instead of serving arrays from a different generator.
+_ARRAY_CACHE_FORMAT = 1
+
+
+def _params_digest(params: Mapping[str, Any]) -> str:
+    keyed = {"params": params, "version": __version__, "format": _ARRAY_CACHE_FORMAT}
+    payload = json.dumps(keyed, sort_keys=True, default=str).encode("utf-8")
+    return blake2b(payload, digest_size=16).hexdigest()
+
+
+def _load_cached_realization(
+    stem: Path, params: Mapping[str, Any]
+) -> tuple[np.ndarray, dict[str, np.ndarray]] | None:
+    # Arrays saved by ``_store_cached_realization``; any mismatch or unreadable file is a miss.
+    try:
+        sidecar = json.loads(stem.with_suffix(".json").read_text())
+        if sidecar.get("params_digest") != _params_digest(params):
+            return None
+        with np.load(stem.with_suffix(".npz")) as data:
+            analog = data["analog"]
+            masks = {
+                key[len("mask__") :]: data[key] for key in data.files if key.startswith("mask__")
+            }
+    except (OSError, ValueError, KeyError):
+        return None
+    return analog, masks
+
+
+def _store_cached_realization(
+    stem: Path, params: Mapping[str, Any], analog: np.ndarray, masks: Mapping[str, Any]
+) -> None:
+    # Only array masks are kept (metadata dicts are not needed to re-render); uncompressed
+    # so reloads are a straight read. The sidecar is written last and marks the entry valid.
+    arrays = {
+        f"mask__{key}": value for key, value in masks.items() if isinstance(value, np.ndarray)
+    }
+    np.savez(stem.with_suffix(".npz"), analog=analog, **arrays)
+    stem.with_suffix(".json").write_text(json.dumps({"params_digest": _params_digest(params)}))
+
+
 def _slider_widget(config: SliderConfig) -> ipw.Widget:
+    ipw = _ipw()
     common = {
         "description": config["label"],
         "min": config["min"],
@@ -611,6 +703,25 @@ def _slider_widget(config: SliderConfig) -> ipw.Widget:
     return ipw.FloatSlider(**common)
 
 
+@lru_cache(maxsize=None)
+def _ipw():
+    # ipywidgets (and the IPython stack behind it) costs ~0.3 s to import; headless callers
+    # such as run_param_batch never need it.
+    import ipywidgets
+
+    return ipywidgets
+
+
+@lru_cache(maxsize=None)
+def _ipycanvas():
+    # Optional: preview rows draw onto an ipycanvas.Canvas when it is installed.
+    try:
+        import ipycanvas
+    except ImportError:  # pragma: no cover - depends on the local environment
+        return None
+    return ipycanvas
+
+
 def _resolve_generator(env: str):
     if env == "fluvial":
         return geologic_generators.generate_fluvial
@@ -620,31 +731,47 @@ def _resolve_generator(env: str):
 def _extract_slider_defaults(
     slider_configs: Mapping[str, SliderGroup | SliderConfig | float],
 ) -> dict[str, float]:
+    # One isinstance per entry; Mapping (not dict) so slider_library()'s read-only views work.
     defaults: dict[str, float] = {}
     for key, value in slider_configs.items():
-        if isinstance(value, dict) and "sliders" in value:
-            for inner_key, config in value["sliders"].items():
-                defaults[inner_key] = float(config["default"])
-        elif isinstance(value, dict) and "default" in value:
+        if not isinstance(value, Mapping):
+            defaults[key] = float(value)
+        elif "sliders" in value:
+            defaults.update(
+                (inner_key, float(config["default"]))
+                for inner_key, config in value["sliders"].items()
+            )
+        elif "default" in value:
             defaults[value.get("key", key)] = float(value["default"])
         else:
             defaults[key] = float(value)
     return defaults
 
 
-def _colorize_masks(env: str, masks: Mapping[str, np.ndarray], shape: tuple[int, int]):
-    palette = utils.palette_for_env("fluvial")
-    channel_masks: dict[str, np.ndarray] = {}
-    for entry in palette:
-        facies = entry["facies"]
-        mask_key = _FACIES_TO_MASK.get(facies, facies)
-        mask = masks.get(mask_key)
-        if mask is None:
-            continue
-        channel_masks[facies] = mask.astype(np.float32)
-    if not channel_masks:
-        channel_masks["channel"] = np.zeros(shape, dtype=np.float32)
-    return utils.boolean_stack_to_rgb(channel_masks, palette)
+def _colorize_masks(
+    env: str,
+    masks: Mapping[str, np.ndarray],
+    shape: tuple[int, int],
+    *,
+    out: np.ndarray | None = None,
+    scratch: np.ndarray | None = None,
+):
+    # ``scratch`` may supply a reusable (len(_FLUVIAL_MASK_KEYS), H, W) float32 stack buffer.
+    present = [
+        (row, mask)
+        for row, key in enumerate(_FLUVIAL_MASK_KEYS)
+        if (mask := masks.get(key)) is not None
+    ]
+    # Facies masks are copied straight into one (F, H, W) float32 stack (cast on assignment)
+    # and composited in a single pass; an empty stack yields a black frame.
+    if scratch is None:
+        stack = np.empty((len(present), *shape), dtype=np.float32)
+    else:
+        stack = scratch[: len(present)]
+    for idx, (_, mask) in enumerate(present):
+        stack[idx] = mask
+    colors = _FLUVIAL_COLORS[[row for row, _ in present]]
+    return utils.stack_to_rgb(stack, colors, out=out)
 
 
 def _make_preview_row(
@@ -656,47 +783,73 @@ def _make_preview_row(
     height: int,
     width: int,
 ) -> ipw.Widget:
-    analog_img = _array_to_image_widget(analog, cmap="gray", width=width, height=height)
-    color_img = _array_to_image_widget(color, cmap=None, width=width, height=height)
-    channel_img = _array_to_image_widget(channel_mask, cmap="gray", width=width, height=height)
+    ipw = _ipw()
+    # One [analog | color | channel] sprite per row: a single PNG and Image widget instead of
+    # three, halving the widgets each preview row adds to the notebook.
+    sprite = np.concatenate(
+        [
+            _as_rgb(utils.png_pixels(analog, "gray")),
+            utils.png_pixels(color, None),
+            _as_rgb(utils.png_pixels(channel_mask, "gray")),
+        ],
+        axis=1,
+    )
+    canvas = _ipycanvas()
+    if canvas is not None:
+        # Raw pixels go over the comm channel; no PNG encode on the interactive path.
+        image = canvas.Canvas(
+            width=sprite.shape[1],
+            height=sprite.shape[0],
+            layout=ipw.Layout(width=f"{3 * (width // 2)}px", height=f"{height // 2}px"),
+        )
+        image.put_image_data(sprite, 0, 0)
+    else:
+        image = ipw.Image(
+            value=_pixels_to_png_bytes(sprite),
+            format="png",
+            width=3 * (width // 2),
+            height=height // 2,
+        )
     metrics_html = ipw.HTML(
         "<br>".join(
             f"<b>{name}</b>: {value:.4f}"
             for name, value in metrics.items()
         )
     )
-    return ipw.HBox([analog_img, color_img, channel_img, metrics_html])
-
-
-def _array_to_image_widget(
-    array: np.ndarray,
-    *,
-    cmap: str | None,
-    width: int,
-    height: int,
-) -> ipw.Image:
-    png_bytes = _array_to_png_bytes(array, cmap=cmap)
-    return ipw.Image(value=png_bytes, format="png", width=width // 2, height=height // 2)
+    return ipw.HBox([image, metrics_html])
 
 
 def _array_to_png_bytes(array: np.ndarray, *, cmap: str | None) -> bytes:
-    import io
-    from matplotlib import pyplot as plt
+    return _pixels_to_png_bytes(utils.png_pixels(array, cmap))
 
-    buf = io.BytesIO()
-    clipped = np.clip(array, 0.0, 1.0)
-    plt.imsave(buf, clipped, cmap=cmap, vmin=0.0, vmax=1.0)
-    buf.seek(0)
-    return buf.read()
 
+# Encoded preview PNGs keyed by pixel digest, so repeated previews of unchanged frames skip
+# the encoder. Hashing a 256x768 RGB uint8 sprite costs ~0.8 ms versus ~15 ms to encode it.
+_PNG_CACHE: OrderedDict[tuple, bytes] = OrderedDict()
+_PNG_CACHE_SIZE = 64
 
-def _save_png(array: np.ndarray, path: Path, *, cmap: str | None) -> None:
-    from matplotlib import pyplot as plt
 
-    path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    clipped = np.clip(array, 0.0, 1.0)
-    if cmap:
-        plt.imsave(path, clipped, cmap=cmap, vmin=0.0, vmax=1.0)
-    else:
-        plt.imsave(path, clipped, vmin=0.0, vmax=1.0)
+def _pixels_to_png_bytes(pixels: np.ndarray) -> bytes:
+    import io
+
+    pixels = np.ascontiguousarray(pixels)
+    digest = blake2b(memoryview(pixels).cast("B"), digest_size=16).digest()
+    key = (digest, pixels.shape)
+    cached = _PNG_CACHE.get(key)
+    if cached is not None:
+        _PNG_CACHE.move_to_end(key)
+        return cached
+    buf = io.BytesIO()
+    utils.encode_png(pixels, buf)
+    png = buf.getvalue()
+    _PNG_CACHE[key] = png
+    if len(_PNG_CACHE) > _PNG_CACHE_SIZE:
+        _PNG_CACHE.popitem(last=False)
+    return png
+
+
+def _as_rgb(pixels: np.ndarray) -> np.ndarray:
+    # (H, W) gray or (H, W, 4) RGBA pixels as (H, W, 3) RGB.
+    if pixels.ndim == 2:
+        return np.repeat(pixels[..., None], 3, axis=2)
+    return pixels[..., :3]
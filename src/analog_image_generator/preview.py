@@ -7,17 +7,26 @@ placeholder noise until the actual geologic generators come online.
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
 import numpy as np
 
-from . import geologic_generators
+try:  # Optional Rust JSON encoder; the stdlib writes the same layout.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the local environment
+    orjson = None
+
+from . import geologic_generators, utils
 
 Environment = Literal["fluvial", "aeolian", "estuarine"]
 ENVIRONMENTS: tuple[Environment, ...] = ("fluvial", "aeolian", "estuarine")
+MaskDtype = Literal["uint8", "float32"]
+MASK_DTYPES: tuple[MaskDtype, ...] = ("uint8", "float32")
 
 
 @dataclass(frozen=True)
@@ -36,12 +45,15 @@ def generate_preview(
     height: int = 512,
     seed: int = 0,
     params: dict | None = None,
+    generate_masks: bool = True,
 ) -> tuple[np.ndarray, dict[str, np.ndarray], dict]:
     """Render or synthesize a preview for *env*.
 
     The returned analog array is normalized to ``[0, 1]`` for easier plotting.
     Masks (if any) are normalized the same way. ``metadata`` records whether the
-    result came from a real generator or the placeholder fallback.
+    result came from a real generator or the placeholder fallback. With
+    ``generate_masks=False`` no mask rasters are returned; their names are still
+    listed in ``metadata["mask_names"]``.
     """
 
     generator = _resolve_generator(env)
@@ -62,7 +74,13 @@ def generate_preview(
         source = "placeholder"
 
     analog_array = _normalize_array(analog)
-    mask_arrays = {name: _normalize_array(mask) for name, mask in masks.items()}
+    # Generators also return metadata payloads (dicts, 1-D summaries) alongside rasters.
+    raster_names = sorted(
+        name for name, mask in masks.items() if isinstance(mask, np.ndarray) and mask.ndim >= 2
+    )
+    mask_arrays: dict[str, np.ndarray] = {}
+    if generate_masks:
+        mask_arrays = {name: _normalize_array(masks[name]) for name in raster_names}
 
     metadata = {
         "env": env,
@@ -70,7 +88,7 @@ def generate_preview(
         "height": int(height),
         "seed": int(seed),
         "params": merged_params,
-        "mask_names": sorted(mask_arrays.keys()),
+        "mask_names": raster_names,
         "source": source,
         "note": note,
         "generated_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
@@ -85,11 +103,17 @@ def save_preview(
     *,
     output_dir: Path | str,
     slug: str | None = None,
+    mask_dtype: MaskDtype = "uint8",
 ) -> PreviewArtifacts:
-    """Persist preview outputs to *output_dir* and return their paths."""
+    """Persist preview outputs to *output_dir* and return their paths.
 
-    from matplotlib import pyplot as plt  # Imported lazily to avoid global side effects
+    ``mask_dtype="uint8"`` quantizes mask rasters to 8-bit grayscale PNGs before
+    encoding; ``"float32"`` rasterises them through the gray colormap exactly as
+    ``plt.imsave`` would. Every PNG is written by Pillow without touching pyplot.
+    """
 
+    if mask_dtype not in MASK_DTYPES:
+        raise ValueError(f"mask_dtype must be one of {MASK_DTYPES}, got {mask_dtype!r}")
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -98,21 +122,25 @@ def save_preview(
     analog_path = output_dir / f"{slug}.png"
     metadata_path = output_dir / f"{slug}.json"
 
-    plt.imsave(analog_path, analog, cmap="gray", vmin=0.0, vmax=1.0)
+    utils.save_png(analog, analog_path, cmap="gray")
 
     mask_paths: dict[str, Path] = {}
     for name, array in masks.items():
         safe_name = name.replace(" ", "-")
         mask_path = output_dir / f"{slug}__{safe_name}.png"
-        plt.imsave(mask_path, array, cmap="gray", vmin=0.0, vmax=1.0)
+        if mask_dtype == "uint8":
+            _save_uint8_png(array, mask_path)
+        else:
+            utils.save_png(array, mask_path, cmap="gray")
         mask_paths[name] = mask_path
 
     metadata = dict(metadata)
     metadata["artifacts"] = {
         "analog": analog_path.name,
         "masks": {name: path.name for name, path in mask_paths.items()},
+        "mask_dtype": mask_dtype,
     }
-    metadata_path.write_text(_json_dumps(metadata))
+    metadata_path.write_bytes(_json_bytes(metadata))
 
     return PreviewArtifacts(
         analog_path=analog_path,
@@ -132,12 +160,22 @@ def _resolve_generator(env: Environment):
 
 def _placeholder_preview(width: int, height: int, seed: int) -> np.ndarray:
     rng = np.random.default_rng(seed)
+    noise = rng.standard_normal((height, width), dtype=np.float32)
+    noise *= np.float32(0.15)
+    noise += _placeholder_base(width, height)
+    return _normalize_array(noise)
+
+
+@lru_cache(maxsize=8)
+def _placeholder_base(width: int, height: int) -> np.ndarray:
+    # Gradient + belts depend only on the shape; batch previews reuse one read-only copy.
     gradient = np.linspace(0.1, 0.9, width, dtype=np.float32)
     gradient = np.tile(gradient, (height, 1))
-    noise = rng.normal(0.0, 0.15, size=(height, width)).astype(np.float32)
     belts = np.sin(np.linspace(0, np.pi, height, dtype=np.float32)[:, None] * 3.0)
     belts = (belts + 1.0) * 0.2
-    return _normalize_array(gradient + belts + noise)
+    base = gradient + belts
+    base.setflags(write=False)
+    return base
 
 
 def _normalize_array(array) -> np.ndarray:
@@ -146,15 +184,47 @@ def _normalize_array(array) -> np.ndarray:
         arr = arr[..., 0]
     if arr.ndim != 2:
         raise ValueError("Preview expects 2D arrays")
-    arr = np.nan_to_num(arr)
     arr_min = float(arr.min())
     arr_max = float(arr.max())
+    if not (np.isfinite(arr_min) and np.isfinite(arr_max)):
+        # NaN/inf are rare; only then pay for the sanitised copy.
+        arr = np.nan_to_num(arr)
+        arr_min = float(arr.min())
+        arr_max = float(arr.max())
     if arr_max - arr_min <= 1e-8:
         return np.zeros_like(arr)
-    return (arr - arr_min) / (arr_max - arr_min)
+    out = np.subtract(arr, arr_min, out=np.empty_like(arr))
+    return np.divide(out, arr_max - arr_min, out=out)
+
+
+def _to_uint8(array: np.ndarray) -> np.ndarray:
+    scaled = np.clip(np.asarray(array, dtype=np.float32), 0.0, 1.0) * 255.0
+    return np.rint(scaled).astype(np.uint8)
+
+
+def _save_uint8_png(array: np.ndarray, path: Path) -> None:
+    utils.encode_png(_to_uint8(array), path)
+
 
+def _json_bytes(payload: dict) -> bytes:
+    # Sorted, 2-space-indented UTF-8 from either encoder; numpy values and paths via _np_default.
+    if orjson is not None:
+        option = (
+            orjson.OPT_INDENT_2
+            | orjson.OPT_SORT_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_NON_STR_KEYS
+        )
+        return orjson.dumps(payload, default=_np_default, option=option)
+    text = json.dumps(payload, indent=2, sort_keys=True, ensure_ascii=False, default=_np_default)
+    return text.encode("utf-8")
 
-def _json_dumps(payload: dict) -> str:
-    import json
 
-    return json.dumps(payload, indent=2, sort_keys=True)
+def _np_default(value: object) -> object:
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, Path):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
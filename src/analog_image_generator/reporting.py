@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 import io
-from dataclasses import dataclass, field
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields, is_dataclass
+from itertools import compress
 from pathlib import Path
 from typing import Iterable, Mapping, Sequence
 
 import numpy as np
 import pandas as pd
-from matplotlib import pyplot as plt
-from PyPDF2 import PdfMerger
+from matplotlib.figure import Figure
+from pypdf import PdfWriter
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
@@ -66,43 +69,67 @@ CSV_COLUMNS = [
 ]
 
 
-def build_reports(metrics_rows: Iterable[Mapping[str, object]], output_dir: Path | str) -> dict[str, Path]:
-    """Create CSV + PDFs from the supplied metrics rows."""
+def build_reports(
+    metrics_rows: Iterable[Mapping[str, object]],
+    output_dir: Path | str,
+    *,
+    n_jobs: int | None = 1,
+) -> dict[str, Path]:
+    """Create CSV + PDFs from the supplied metrics rows (mappings or dataclass rows).
+
+    ``n_jobs > 1`` renders the per-env PDFs in worker processes; ``None`` uses every CPU.
+    """
 
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
-    materialized = list(metrics_rows)
+    materialized = [_row_mapping(row) for row in metrics_rows]
     if not materialized:
         raise ValueError("metrics_rows must contain at least one entry")
-    csv_path = _write_csv(materialized, output_path)
-    mosaics = _generate_mosaics(materialized, output_path / "mosaics")
-    env_pdfs = _build_env_pdfs(materialized, mosaics, output_path / "pdfs")
+    frame = _metrics_frame(materialized)
+    csv_path = _write_csv(frame, output_path)
+    env_groups = {
+        env: env_frame.reset_index(drop=True) for env, env_frame in frame.groupby("env", sort=False)
+    }
+    mosaics = _generate_mosaics(env_groups, output_path / "mosaics")
+    env_pdfs = _build_env_pdfs(env_groups, mosaics, output_path / "pdfs", n_jobs=n_jobs)
     master_pdf = _merge_master_pdf(env_pdfs, output_path / "master_report.pdf")
     return {"csv": csv_path, "env_pdfs": env_pdfs, "master_pdf": master_pdf}
 
 
-def _write_csv(rows: list[Mapping[str, object]], output_dir: Path) -> Path:
+def _row_mapping(row: Mapping[str, object] | object) -> Mapping[str, object]:
+    if is_dataclass(row) and not isinstance(row, type):
+        # Shallow field copy; dataclasses.asdict would deep-copy the raster payloads.
+        return {f.name: getattr(row, f.name) for f in fields(row)}
+    return row
+
+
+def _metrics_frame(rows: list[Mapping[str, object]]) -> pd.DataFrame:
+    # Every row as one frame (raster payloads stay object columns); the CSV, histograms and
+    # summary tables all read columns from it instead of walking the row dicts.
     frame = pd.DataFrame(rows)
     missing = [col for col in CSV_COLUMNS if col not in frame.columns]
     if missing:
         raise ValueError(f"metrics_rows missing required columns: {missing}")
-    frame = frame[CSV_COLUMNS]
+    return frame
+
+
+def _write_csv(frame: pd.DataFrame, output_dir: Path) -> Path:
     csv_path = output_dir / "metrics.csv"
     output_dir.mkdir(parents=True, exist_ok=True)
-    frame.to_csv(csv_path, index=False)
+    frame[CSV_COLUMNS].to_csv(csv_path, index=False)
     return csv_path
 
 
-def _generate_mosaics(rows: list[Mapping[str, object]], output_dir: Path) -> dict[str, dict[str, Path]]:
+def _generate_mosaics(
+    env_groups: Mapping[str, pd.DataFrame],
+    output_dir: Path,
+) -> dict[str, dict[str, Path]]:
     output_dir.mkdir(parents=True, exist_ok=True)
-    env_groups: dict[str, list[Mapping[str, object]]] = {}
-    for row in rows:
-        env_groups.setdefault(row["env"], []).append(row)
     mosaics: dict[str, dict[str, Path]] = {}
-    for env, env_rows in env_groups.items():
-        sample = env_rows[0]
-        gray = sample.get("gray")
-        color = sample.get("color")
+    for env, env_frame in env_groups.items():
+        sample = env_frame.iloc[0]
+        gray = _raster_payload(sample, "gray")
+        color = _raster_payload(sample, "color")
         if gray is None or color is None:
             continue
         gray_path = output_dir / f"{env}_gray.png"
@@ -113,26 +140,49 @@ def _generate_mosaics(rows: list[Mapping[str, object]], output_dir: Path) -> dic
     return mosaics
 
 
+def _raster_payload(sample: pd.Series, key: str) -> object | None:
+    # A row without the payload shows up as a missing column or a NaN cell in the frame.
+    value = sample.get(key)
+    if value is None or (pd.api.types.is_scalar(value) and pd.isna(value)):
+        return None
+    return value
+
+
 def _build_env_pdfs(
-    rows: list[Mapping[str, object]],
+    env_groups: Mapping[str, pd.DataFrame],
     mosaics: Mapping[str, Mapping[str, Path]],
     output_dir: Path,
+    *,
+    n_jobs: int | None = 1,
 ) -> list[Path]:
     output_dir.mkdir(parents=True, exist_ok=True)
-    env_groups: dict[str, list[Mapping[str, object]]] = {}
-    for row in rows:
-        env_groups.setdefault(row["env"], []).append(row)
-    env_pdfs: list[Path] = []
-    for env, env_rows in env_groups.items():
-        pdf_path = output_dir / f"{env}_report.pdf"
-        _render_env_pdf(env, env_rows, mosaics.get(env, {}), pdf_path)
-        env_pdfs.append(pdf_path)
+    env_pdfs = [output_dir / f"{env}_report.pdf" for env in env_groups]
+    workers = min(len(env_groups), n_jobs or os.cpu_count() or 1)
+    if workers <= 1:
+        for (env, env_frame), pdf_path in zip(env_groups.items(), env_pdfs):
+            _render_env_pdf(env, env_frame, mosaics.get(env, {}), pdf_path)
+        return env_pdfs
+    # Envs share no state, so each PDF renders in its own process. The raster payloads
+    # stay behind; the pages only read metric columns and the mosaic files.
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(
+                _render_env_pdf,
+                env,
+                env_frame.drop(columns=["gray", "color"], errors="ignore"),
+                dict(mosaics.get(env, {})),
+                pdf_path,
+            )
+            for (env, env_frame), pdf_path in zip(env_groups.items(), env_pdfs)
+        ]
+        for future in futures:
+            future.result()
     return env_pdfs
 
 
 def _render_env_pdf(
     env: str,
-    rows: list[Mapping[str, object]],
+    frame: pd.DataFrame,
     mosaic_paths: Mapping[str, Path],
     pdf_path: Path,
 ) -> None:
@@ -145,67 +195,75 @@ def _render_env_pdf(
         c.drawImage(ImageReader(mosaic_paths["gray"]), 36, y - 256, width=256, height=256)
     if mosaic_paths.get("color"):
         c.drawImage(ImageReader(mosaic_paths["color"]), 320, y - 256, width=256, height=256)
-    beta_hist = _histogram(rows, "beta_iso")
-    entropy_hist = _histogram(rows, "entropy_global")
+    # One pyplot-free figure per report, cleared for each histogram and dropped with the PDF.
+    hist_fig = Figure(figsize=(2.5, 2.5))
+    beta_hist = _histogram(frame, "beta_iso", hist_fig)
+    entropy_hist = _histogram(frame, "entropy_global", hist_fig)
     if beta_hist:
         c.drawImage(ImageReader(beta_hist), 36, y - 512, width=256, height=180)
     if entropy_hist:
         c.drawImage(ImageReader(entropy_hist), 320, y - 512, width=256, height=180)
     table_y = 120
-    _draw_summary_table(c, rows, table_y)
+    _draw_summary_table(c, frame, table_y)
     c.showPage()
     c.save()
 
 
-def _histogram(rows: Sequence[Mapping[str, object]], field: str) -> io.BytesIO | None:
-    values = [float(row[field]) for row in rows if row.get(field) is not None]
-    if not values:
+def _histogram(frame: pd.DataFrame, field: str, fig: Figure) -> io.BytesIO | None:
+    values = frame[field].dropna().to_numpy(dtype=np.float64)
+    if not values.size:
         return None
+    fig.clear()
+    ax = fig.add_subplot()
+    ax.hist(values, bins=10, color="#264653")
+    ax.set_title(field)
+    fig.tight_layout()
     buf = io.BytesIO()
-    plt.figure(figsize=(2.5, 2.5))
-    plt.hist(values, bins=10, color="#264653")
-    plt.title(field)
-    plt.tight_layout()
-    plt.savefig(buf, format="png")
-    plt.close()
+    fig.savefig(buf, format="png")
     buf.seek(0)
     return buf
 
 
-def _draw_summary_table(canvas_obj: canvas.Canvas, rows: Sequence[Mapping[str, object]], y: float) -> None:
-    canvas_obj.setFont("Helvetica", 9)
+def _draw_summary_table(canvas_obj: canvas.Canvas, frame: pd.DataFrame, y: float) -> None:
     headers = ["Realization", "β_iso", "D", "PSD_AR", "QA Flags"]
-    canvas_obj.drawString(36, y + 16, "Summary")
-    data = [headers]
-    for row in rows[:8]:
-        flags = ", ".join([name.replace("qa_", "") for name, value in row.items() if name.startswith("qa_") and value])
-        data.append(
-            [
-                str(row.get("realization_id", "")),
-                f"{row.get('beta_iso', 0):.3f}",
-                f"{row.get('fractal_dimension', 0):.3f}",
-                f"{row.get('psd_aspect', 0):.2f}",
-                flags or "—",
-            ]
-        )
+    head = frame.head(8)
+    qa_columns = [name for name in head.columns if name.startswith("qa_")]
+    qa_labels = [name.replace("qa_", "") for name in qa_columns]
+    qa = head[qa_columns]
+    raised = (qa.notna() & qa.astype(bool)).to_numpy()
+    flags = [", ".join(compress(qa_labels, row_flags)) or "—" for row_flags in raised]
+    columns = [
+        head["realization_id"].astype(str).to_list(),
+        head["beta_iso"].map("{:.3f}".format).to_list(),
+        head["fractal_dimension"].map("{:.3f}".format).to_list(),
+        head["psd_aspect"].map("{:.2f}".format).to_list(),
+        flags,
+    ]
+    data = [headers, *map(list, zip(*columns))]
     col_width = 120
+    # One text object for the whole table: a single BT/ET block with the font set once,
+    # instead of a separate text block per drawString cell.
+    text = canvas_obj.beginText()
+    text.setFont("Helvetica", 9)
+    text.setTextOrigin(36, y + 16)
+    text.textOut("Summary")
     for r_idx, row in enumerate(data):
         x = 36
         for value in row:
-            canvas_obj.drawString(x, y - 12 * r_idx, value)
+            text.setTextOrigin(x, y - 12 * r_idx)
+            text.textOut(value)
             x += col_width
+    canvas_obj.drawText(text)
 
 
 def _merge_master_pdf(env_pdfs: Sequence[Path], output_path: Path) -> Path:
-    merger = PdfMerger()
-    for pdf in env_pdfs:
-        merger.append(str(pdf))
-    with output_path.open("wb") as fh:
-        merger.write(fh)
+    with PdfWriter() as writer:
+        for pdf in env_pdfs:
+            writer.append(str(pdf))
+        with output_path.open("wb") as fh:
+            writer.write(fh)
     return output_path
 
 
 def _save_image(array: np.ndarray, path: Path, *, cmap: str | None) -> None:
-    path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    plt.imsave(path, np.clip(array, 0.0, 1.0), cmap=cmap, vmin=0.0, vmax=1.0)
+    utils.save_png(array, path, cmap=cmap)
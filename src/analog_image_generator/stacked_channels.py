@@ -158,9 +158,7 @@ def _build_package_specs(params: dict, package_count: int) -> list[PackageSpec]:
     for idx in range(package_count):
         style = style_sequence[idx % len(style_sequence)]
         override = overrides[idx % len(overrides)] if overrides else {}
-        package_params = dict(base_params)
-        package_params.update(override or {})
-        package_params["style"] = style
+        package_params = {**base_params, **(override or {}), "style": style}
         specs.append(
             PackageSpec(
                 style=style,
@@ -202,7 +200,9 @@ def sequence_packages(
     height, width = base_grid_shape
     height = int(height)
     width = int(width)
-    stacked_slices: list[Array] = []
+    # One preallocated stack filled in place; each cut only rewrites the current top layer.
+    stack = np.empty((len(package_specs), height, width), dtype=np.float32)
+    count = 0
     aggregated_masks: dict[str, Array] = {}
     package_metadata: list[PackageMetadata] = []
     realization_payloads: list[dict] = []
@@ -210,23 +210,27 @@ def sequence_packages(
     current_surface = np.zeros((height, width), dtype=np.float32)
     erosion_surface = np.zeros((height, width), dtype=np.float32)
 
+    generators = _get_generator_map()
     for idx, spec in enumerate(package_specs):
-        generator = _get_generator_map()[spec.style]
+        generator = generators[spec.style]
         package_seed = spec.seed if spec.seed is not None else int(rng.integers(0, 1_000_000))
         package_rng = utils.seeded_rng(package_seed)
-        params = dict(spec.params)
-        params["height"] = height
-        params["width"] = width
-        params["seed"] = package_seed
-        params["style"] = spec.style
+        params = {
+            **spec.params,
+            "height": height,
+            "width": width,
+            "seed": package_seed,
+            "style": spec.style,
+        }
 
         gray, masks = generator(params, package_rng)
         gray = gray.astype(np.float32)
-        if stacked_slices:
-            prev_stack = np.stack(stacked_slices, axis=0)
-            trimmed_stack, erosion_mask = cut_erosional_surface(prev_stack, spec.erosion_depth_px, spec.style)
-            stacked_slices = [trimmed_stack[i] for i in range(trimmed_stack.shape[0])]
-            erosion_surface = np.maximum(erosion_surface, erosion_mask)
+        if count:
+            prev_stack = stack[:count]
+            _, erosion_mask = cut_erosional_surface(
+                prev_stack, spec.erosion_depth_px, spec.style, out=prev_stack
+            )
+            np.maximum(erosion_surface, erosion_mask, out=erosion_surface)
         relief_gray, current_surface = apply_relief_slice(
             gray,
             current_surface,
@@ -234,7 +238,8 @@ def sequence_packages(
             spec.relief_px,
             rng,
         )
-        stacked_slices.append(relief_gray)
+        stack[count] = relief_gray
+        count += 1
         _merge_masks(aggregated_masks, masks)
         if "realization_metadata" in masks and isinstance(masks["realization_metadata"], dict):
             realization_payloads.append(dict(masks["realization_metadata"]))
@@ -253,7 +258,6 @@ def sequence_packages(
             )
         )
 
-    stack = np.stack(stacked_slices, axis=0) if stacked_slices else np.zeros((0, height, width), dtype=np.float32)
     composite, package_id_map = _composite_from_stack(stack, package_ids)
     aggregated_masks["upper_surface_mask"] = composite > 0.0
     aggregated_masks["upper_surface_mask"] = aggregated_masks["upper_surface_mask"].astype(np.float32)
@@ -278,67 +282,86 @@ def apply_relief_slice(
     """Apply a simple relief transform to a slice and update vertical surface."""
 
     relief_px = max(relief_px, 0.0)
-    base = gray.astype(np.float32)
-    relief_noise = rng.standard_normal(base.shape).astype(np.float32)
+    base = np.asarray(gray, dtype=np.float32)
     sigma = max(1.0, relief_px / 8.0)
-    relief_field = ndimage.gaussian_filter(relief_noise, sigma=sigma)
-    if float(np.max(np.abs(relief_field))) > 0.0:
-        relief_field /= float(np.max(np.abs(relief_field)))
+    relief_field = utils.noise_bank(base.shape, rng, (sigma,))[0]
+    # max|x| from the two extrema, without materialising abs(); the rest runs in place.
+    peak = max(float(relief_field.max()), -float(relief_field.min()))
+    if peak > 0.0:
+        relief_field /= peak
     relief_field *= relief_px / max(float(base.shape[0]), float(base.shape[1]), 1.0)
-    modulated = np.clip(base + relief_field * 0.15, 0.0, 1.0)
-    updated_surface = np.clip(current_surface + thickness_px + relief_field, 0.0, None)
-    return modulated.astype(np.float32), updated_surface.astype(np.float32)
+    modulated = np.multiply(relief_field, 0.15)
+    modulated += base
+    np.clip(modulated, 0.0, 1.0, out=modulated)
+    updated_surface = np.add(current_surface, thickness_px, dtype=np.float32)
+    updated_surface += relief_field
+    np.maximum(updated_surface, 0.0, out=updated_surface)
+    return modulated, updated_surface
 
 
 def cut_erosional_surface(
     previous_stack: Array,
     relief_px: float,
     style: FluvialStyle,
+    *,
+    out: Array | None = None,
 ) -> tuple[Array, Array]:
-    """Apply a deterministic erosional trim to the previous stack."""
+    """Apply a deterministic erosional trim to the previous stack.
+
+    The trimmed stack is written to ``out`` (a fresh copy by default); passing
+    ``out=previous_stack`` trims in place, touching only the top layer.
+    """
 
     if previous_stack.size == 0:
         shape = previous_stack.shape[1:] if previous_stack.ndim == 3 else (0, 0)
         return previous_stack, np.zeros(shape, dtype=np.float32)
     top_surface = previous_stack[-1]
-    gradient = np.abs(ndimage.sobel(top_surface))
-    if float(gradient.max()) > 0.0:
-        gradient /= float(gradient.max())
+    # abs, normalise and threshold all reuse the sobel buffer. Comparing against
+    # threshold * peak would skip the division but can flip pixels sitting on the
+    # float32-rounded boundary, so the normalised comparison stays.
+    gradient = ndimage.sobel(top_surface)
+    np.abs(gradient, out=gradient)
+    peak = float(gradient.max())
+    if peak > 0.0:
+        gradient /= peak
     style_bias = {"braided": 0.25, "anastomosing": 0.15, "meandering": 0.1}.get(style, 0.12)
     threshold = np.clip(0.45 - style_bias + relief_px / 300.0, 0.05, 0.95)
-    erosion_mask = (gradient > threshold).astype(np.float32)
-    trimmed_stack = previous_stack.copy()
-    trimmed_stack[-1] = np.where(erosion_mask > 0.5, trimmed_stack[-1] * 0.7, trimmed_stack[-1])
-    return trimmed_stack, erosion_mask
+    eroded = gradient > threshold
+    if out is None:
+        out = previous_stack.copy()
+    elif out is not previous_stack:
+        out[...] = previous_stack
+    top = out[-1]
+    np.multiply(top, 0.7, out=top, where=eroded)
+    return out, eroded.astype(np.float32)
 
 
 def _composite_from_stack(stack: Array, package_ids: Sequence[int]) -> tuple[Array, Array]:
     if stack.size == 0:
         shape = (0, 0)
         return np.zeros(shape, dtype=np.float32), np.zeros(shape, dtype=np.float32)
-    height, width = stack.shape[1], stack.shape[2]
-    composite = np.zeros((height, width), dtype=np.float32)
-    package_id_map = np.full((height, width), -1, dtype=np.int32)
-    visible = np.zeros((height, width), dtype=bool)
-    for idx in reversed(range(stack.shape[0])):
-        slice_gray = stack[idx]
-        mask = slice_gray > 1e-3
-        fill = mask & (~visible)
-        composite[fill] = slice_gray[fill]
-        package_id_map[fill] = package_ids[idx]
-        visible |= mask
-    return composite.astype(np.float32), package_id_map.astype(np.float32)
+    # Topmost layer above the threshold wins: one argmax over the reversed stack finds it
+    # for every pixel at once instead of a masked fill per layer.
+    stack_rev = stack[::-1]
+    hits = stack_rev > 1e-3
+    any_hit = hits.any(axis=0)
+    first_hit = hits.argmax(axis=0)
+    top = np.take_along_axis(stack_rev, first_hit[None], axis=0)[0]
+    composite = np.where(any_hit, top, 0.0).astype(np.float32)
+    ids_rev = np.asarray(package_ids[::-1], dtype=np.float32)
+    package_id_map = np.where(any_hit, ids_rev[first_hit], np.float32(-1.0))
+    return composite, package_id_map.astype(np.float32, copy=False)
 
 
 def _merge_masks(store: dict[str, Array], masks: dict[str, Array]) -> None:
     for key, value in masks.items():
         if not isinstance(value, np.ndarray):
             continue
-        arr = value.astype(np.float32)
-        if key not in store:
-            store[key] = arr
+        merged = store.get(key)
+        if merged is None:
+            store[key] = value.astype(np.float32)  # Owned copy, safe to accumulate into
         else:
-            store[key] = np.maximum(store[key], arr)
+            np.maximum(merged, value, out=merged)
 
 
 def _mask_means(masks: dict[str, Array]) -> dict[str, float]:
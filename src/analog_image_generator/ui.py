@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Iterable, Mapping, Sequence
+import asyncio
+from collections import OrderedDict
+from typing import Callable, Iterable, Mapping, Sequence
 
 import ipywidgets as widgets
 import pandas as pd
@@ -11,6 +13,82 @@ from IPython.display import Markdown, display
 from . import interactive
 
 
+class _Debouncer:
+    """Collapse a burst of calls into one, ``delay`` seconds after the last.
+
+    Scheduling uses the running asyncio loop (the kernel's, in Jupyter). Without one, as in
+    scripts and tests, each call runs immediately.
+    """
+
+    def __init__(self, fn: Callable[[], None], delay: float) -> None:
+        self._fn = fn
+        self._delay = delay
+        self._handle: asyncio.TimerHandle | None = None
+
+    def __call__(self, *_: object) -> None:
+        self.cancel()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._fn()
+            return
+        self._handle = loop.call_later(self._delay, self._fire)
+
+    def cancel(self) -> None:
+        """Drop a scheduled call, if any."""
+
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _fire(self) -> None:
+        self._handle = None
+        self._fn()
+
+
+# Fluvial previews keyed by their full parameter set (seed included). Realizations are
+# deterministic per seed, so returning to an earlier slider configuration reuses its widgets.
+_PREVIEW_CACHE: OrderedDict[tuple, interactive.PreviewResult] = OrderedDict()
+_PREVIEW_CACHE_SIZE = 16
+
+
+def _hashable_params(value: object) -> object:
+    # Lists, tuples and mappings (e.g. package_styles) become tuples tagged with their container
+    # type, so the key hashes without a list colliding with a tuple or a dict with its items.
+    if isinstance(value, Mapping):
+        items = sorted(value.items(), key=lambda item: repr(item[0]))
+        return ("mapping", tuple((name, _hashable_params(item)) for name, item in items))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_hashable_params(item) for item in value))
+    return value
+
+
+def _preview_key(params: Mapping[str, object]) -> tuple | None:
+    """Return a hashable cache key for ``params``, or ``None`` if it cannot be hashed."""
+
+    key = _hashable_params(params)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _cached_preview(params: Mapping[str, object]) -> interactive.PreviewResult:
+    key = _preview_key(params)
+    cached = _PREVIEW_CACHE.get(key) if key is not None else None
+    if cached is not None:
+        _PREVIEW_CACHE.move_to_end(key)
+        return cached
+    preview = interactive.preview_sequence("fluvial", params, seeds=[params["seed"]])
+    if key is None:
+        return preview
+    _PREVIEW_CACHE[key] = preview
+    if len(_PREVIEW_CACHE) > _PREVIEW_CACHE_SIZE:
+        _PREVIEW_CACHE.popitem(last=False)
+    return preview
+
+
 def _make_slider_widget(cfg: Mapping[str, object], *, description_width: str, slider_width: str) -> widgets.Widget:
     common = dict(
         description=cfg["label"],
@@ -33,14 +111,19 @@ def build_live_fluvial_panel(
     description_width: str = "160px",
     panel_width: str = "460px",
     auto_run: bool = False,
+    debounce_s: float = 0.15,
+    n_jobs: int = 1,
 ) -> dict[str, widgets.Widget]:
     """
     Build a style-aware fluvial interactive panel with optional auto-run previews.
 
-    Returns useful widgets in a dict: ui, run_button, status, output_area, batch_output, etc.
+    Auto-run changes arriving within ``debounce_s`` seconds of each other trigger a single
+    preview. Batch runs generate uncached seeds serially unless ``n_jobs > 1``, which spreads
+    them over that many worker processes. Returns useful widgets in a dict: ui, run_button,
+    status, output_area, batch_output, etc.
     """
 
-    slider_groups = interactive.build_sliders("fluvial")
+    slider_groups = interactive.slider_library("fluvial")
     slider_widgets: dict[str, widgets.Widget] = {}
     group_boxes: dict[str, widgets.Widget] = {}
     group_order: list[str] = []
@@ -121,7 +204,7 @@ def build_live_fluvial_panel(
         status.value = "<b>Running…</b>"
         try:
             params = current_params()
-            preview = interactive.preview_sequence("fluvial", params, seeds=[params["seed"]])
+            preview = _cached_preview(params)
             with output_area:
                 output_area.clear_output()
                 display(
@@ -158,14 +241,23 @@ def build_live_fluvial_panel(
                 print("No valid seeds.")
             return
         params = current_params()
-        rows = []
-        for seed in seeds:
-            params_seed = dict(params)
-            params_seed["seed"] = seed
-            preview = interactive.preview_sequence("fluvial", params_seed, seeds=[seed])
-            if not preview.frames:
-                continue
-            rows.append({"seed": seed, **preview.frames[0]["metrics"]})
+        metrics_by_seed: dict[int, dict] = {}
+        pending: list[int] = []
+        for seed in dict.fromkeys(seeds):
+            key = _preview_key({**params, "seed": seed})
+            hit = _PREVIEW_CACHE.get(key) if key is not None else None
+            if hit is not None and hit.frames:
+                metrics_by_seed[seed] = hit.frames[0]["metrics"]
+            else:
+                pending.append(seed)
+        if pending:
+            # Uncached seeds are independent realizations; with n_jobs > 1 one call spreads
+            # them over worker processes (generate_fluvial_batch) instead of running in turn.
+            batch = interactive.preview_sequence("fluvial", params, seeds=pending, n_jobs=n_jobs)
+            metrics_by_seed.update((frame["seed"], frame["metrics"]) for frame in batch.frames)
+        rows = [
+            {"seed": seed, **metrics_by_seed[seed]} for seed in seeds if seed in metrics_by_seed
+        ]
         with batch_output:
             batch_output.clear_output()
             if rows:
@@ -175,15 +267,25 @@ def build_live_fluvial_panel(
             else:
                 print("No batch frames produced.")
 
-    def schedule_preview(change=None):
-        if not auto_run_toggle.value:
-            return
+    def start_preview():
         if state["running"]:
             state["pending"] = True
             return
         render_preview()
 
-    run_button.on_click(lambda _: render_preview())
+    debounced_preview = _Debouncer(start_preview, debounce_s)
+
+    def schedule_preview(change=None):
+        if not auto_run_toggle.value:
+            return
+        debounced_preview()
+
+    def run_now(_=None):
+        # An explicit run covers any auto-run still waiting out its debounce delay.
+        debounced_preview.cancel()
+        start_preview()
+
+    run_button.on_click(run_now)
     batch_button.on_click(run_batch)
     mode_toggle.observe(apply_visibility, names="value")
     style_dropdown.observe(apply_visibility, names="value")
@@ -8,13 +8,25 @@ section.
 
 from __future__ import annotations
 
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from hashlib import blake2b
-from typing import Iterable, Mapping, Sequence
+from pathlib import Path
+from typing import IO, Iterable, Mapping, Sequence
 
 import numpy as np
 from numpy.typing import NDArray
 from scipy import ndimage
 
+from . import backend
+
+try:  # Optional C++ EDT backend; SciPy remains the reference implementation.
+    import cv2
+except ImportError:  # pragma: no cover - depends on the local environment
+    cv2 = None
+
 Array = NDArray[np.float32]
 RGBArray = NDArray[np.float32]
 
@@ -26,9 +38,13 @@ __all__ = [
     "make_field",
     "normalized_coords",
     "distance_to_mask",
+    "distance_to_mask_batch",
     "signed_distance",
     "blend_masks",
     "boolean_stack_to_rgb",
+    "png_pixels",
+    "encode_png",
+    "save_png",
     "mask_metadata",
     "palette_for_env",
     "PALETTES",
@@ -92,6 +108,8 @@ def make_field(height: int, width: int, fill: float = 0.0) -> Array:
     """Allocate an ``H×W`` float32 field filled with ``fill`` (utilities-grids)."""
 
     _validate_hw(height, width)
+    if fill == 0.0 and not np.signbit(fill):
+        return np.zeros((height, width), dtype=np.float32)  # calloc: pages zeroed lazily
     return np.full((height, width), fill, dtype=np.float32)
 
 
@@ -104,41 +122,157 @@ def normalized_coords(
     """Return normalized coordinate grids (utilities-grids anchor)."""
 
     _validate_hw(height, width)
-    scale = np.linspace(0.0, 1.0, height, dtype=np.float32)
-    yy = np.repeat(scale[:, None], width, axis=1)
+    scale_y = np.linspace(0.0, 1.0, height, dtype=np.float32)
     scale_x = np.linspace(0.0, 1.0, width, dtype=np.float32)
-    xx = np.repeat(scale_x[None, :], height, axis=0)
     if space == "-11":
-        yy = yy * 2.0 - 1.0
-        xx = xx * 2.0 - 1.0
+        # Transform the 1-D axes; each full grid is then written exactly once.
+        scale_y = scale_y * 2.0 - 1.0
+        scale_x = scale_x * 2.0 - 1.0
     elif space != "01":
         raise ValueError("space must be '01' or '-11'")
-    return yy.astype(np.float32), xx.astype(np.float32)
+    yy = np.empty((height, width), dtype=np.float32)
+    xx = np.empty((height, width), dtype=np.float32)
+    yy[...] = scale_y[:, None]
+    xx[...] = scale_x[None, :]
+    return yy, xx
+
+
+def noise_bank(
+    shape: tuple[int, int],
+    rng: np.random.Generator,
+    sigmas: Sequence[float],
+) -> Array:
+    """Gaussian-smoothed noise bands from one white-noise draw (utilities-grids).
+
+    Returns a ``(len(sigmas), H, W)`` float32 stack. The white field is transformed once
+    and each band applies a Gaussian low-pass of width ``sigma`` px in the frequency
+    domain, so the cost does not grow with ``sigma``. ``sigma <= 0`` yields the white
+    field itself. Edges wrap periodically, unlike ``ndimage.gaussian_filter``. The FFTs
+    run on the active ``backend``; the white draw always comes from the host ``rng``.
+    """
+
+    height, width = (int(dim) for dim in shape)
+    _validate_hw(height, width)
+    white = rng.standard_normal((height, width), dtype=np.float32)
+    bank = np.empty((len(sigmas), height, width), dtype=np.float32)
+    _, fft, nd = backend.namespaces()
+    fft_kwargs = {"workers": -1} if backend.active_backend() == "numpy" else {}
+    spectrum = None
+    for idx, sigma in enumerate(sigmas):
+        if sigma <= 0:
+            bank[idx] = white
+            continue
+        if spectrum is None:
+            spectrum = fft.rfft2(backend.to_device(white), **fft_kwargs)
+        band = nd.fourier_gaussian(spectrum, sigma=float(sigma), n=width)
+        bank[idx] = backend.to_host(fft.irfft2(band, s=(height, width), **fft_kwargs))
+    return bank
+
+
+def gaussian_blur(field: np.ndarray, sigma: float, *, out: np.ndarray | None = None) -> Array:
+    """Isotropic Gaussian blur with reflected edges, as float32 (utilities-grids).
+
+    Matches ``ndimage.gaussian_filter`` (``mode="reflect"``, ``truncate=4``). When
+    ``cv2`` is importable the SIMD ``GaussianBlur`` runs instead of SciPy's separable
+    1-D passes, and the CuPy backend takes precedence over both. ``out`` may alias
+    ``field`` for an in-place blur.
+    """
+
+    src = np.asarray(field, dtype=np.float32)
+    if out is None:
+        out = np.empty(src.shape, dtype=np.float32)
+    if backend.active_backend() == "cupy":
+        _, _, nd = backend.namespaces()
+        out[...] = backend.to_host(nd.gaussian_filter(backend.to_device(src), sigma=float(sigma)))
+        return out
+    if cv2 is not None and src.ndim == 2:
+        ksize = 2 * int(4.0 * float(sigma) + 0.5) + 1
+        return cv2.GaussianBlur(
+            src, (ksize, ksize), float(sigma), dst=out, borderType=cv2.BORDER_REFLECT
+        )
+    return ndimage.gaussian_filter(src, sigma=float(sigma), output=out)
+
+
+def sample_sums(stack: np.ndarray, *, dtype: type | None = None) -> NDArray[np.generic]:
+    """Sum each leading-axis sample of ``stack`` over its remaining axes (utilities-grids).
+
+    For an ``(N, H, W)`` mask stack this returns the ``(N,)`` per-sample totals, with
+    ``dtype`` as the accumulator (``None`` keeps NumPy's default). The reduction runs on
+    the active ``backend``, so large preview stacks can be summed on the GPU; the result
+    is always a host array.
+    """
+
+    flat = np.asarray(stack).reshape(len(stack), -1)
+    if backend.active_backend() == "cupy":
+        xp, _, _ = backend.namespaces()
+        return backend.to_host(xp.sum(backend.to_device(flat), axis=1, dtype=dtype))
+    return np.add.reduce(flat, axis=1, dtype=dtype)
 
 
 def distance_to_mask(mask: np.ndarray, *, sampling: Sequence[float] | float | None = None) -> Array:
-    """Unsigned distance (px) to the nearest mask pixel (utilities-distance)."""
+    """Unsigned distance (px) to the nearest mask pixel (utilities-distance).
+
+    Uses OpenCV's exact (``DIST_MASK_PRECISE``) transform when ``cv2`` is importable
+    and no anisotropic ``sampling`` is requested; otherwise falls back to SciPy.
+    """
 
     mask_bool = _mask_bool(mask)
+    if cv2 is not None and sampling is None and mask_bool.any():
+        background = np.ascontiguousarray(~mask_bool, dtype=np.uint8)
+        distances = cv2.distanceTransform(
+            background, cv2.DIST_L2, cv2.DIST_MASK_PRECISE, dstType=cv2.CV_32F
+        )
+        # OpenCV's result can differ from the exact EDT (and between calls) in the last
+        # ulp. Squared pixel distances are integers, so snapping them restores SciPy's
+        # values bit for bit and keeps seeded realizations reproducible.
+        squared = np.square(distances, dtype=np.float64)
+        np.rint(squared, out=squared)
+        return np.sqrt(squared, out=distances)
     distances = ndimage.distance_transform_edt(~mask_bool, sampling=sampling)
     return distances.astype(np.float32)
 
 
+def distance_to_mask_batch(
+    masks: Sequence[np.ndarray],
+    *,
+    sampling: Sequence[float] | float | None = None,
+    max_workers: int | None = None,
+) -> list[Array]:
+    """:func:`distance_to_mask` for independent masks, on a thread pool (utilities-distance).
+
+    OpenCV's transform releases the GIL, as does most of SciPy's, so separate masks overlap
+    on separate cores. Results match per-mask calls. ``max_workers=1`` stays on the calling
+    thread; ``None`` uses every CPU.
+    """
+
+    payloads = list(masks)
+    workers = min(len(payloads), max_workers or os.cpu_count() or 1)
+    if workers <= 1:
+        return [distance_to_mask(mask, sampling=sampling) for mask in payloads]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda mask: distance_to_mask(mask, sampling=sampling), payloads))
+
+
 def signed_distance(
     mask: np.ndarray,
     *,
     sampling: Sequence[float] | float | None = None,
     invert: bool = False,
 ) -> Array:
-    """Signed EDT, negative inside the mask by default (utilities-distance)."""
+    """Signed EDT, negative inside the mask by default (utilities-distance).
+
+    This runs two transforms. Callers that only need distances outside the mask should
+    use :func:`distance_to_mask`, which runs one and is already zero on mask pixels.
+    """
 
     mask_bool = _mask_bool(mask)
-    outside = ndimage.distance_transform_edt(~mask_bool, sampling=sampling)
-    inside = ndimage.distance_transform_edt(mask_bool, sampling=sampling)
-    signed = outside.astype(np.float32)
-    signed[mask_bool] = -inside[mask_bool]
+    # Both sides go through distance_to_mask, so they share its OpenCV fast path.
+    outside = distance_to_mask(mask_bool, sampling=sampling)
+    inside = distance_to_mask(~mask_bool, sampling=sampling)
+    # One masked pass writes -inside over the mask pixels; no gather/scatter temporaries.
+    signed = np.negative(inside, out=outside, where=mask_bool)
     if invert:
-        signed = -signed
+        np.negative(signed, out=signed)
     return signed
 
 
@@ -147,39 +281,122 @@ def blend_masks(masks: Sequence[np.ndarray], weights: Sequence[float] | None = N
 
     if not masks:
         raise ValueError("At least one mask must be provided")
-    stack = np.stack([_ensure_float(mask) for mask in masks], axis=0)
+    height, width = _infer_hw(masks)
+    # Fill a preallocated stack; casting on assignment skips np.stack's per-mask copies.
+    stack = np.empty((len(masks), height, width), dtype=np.float32)
+    for idx, mask in enumerate(masks):
+        stack[idx] = mask
     if weights is None:
         blended = stack.mean(axis=0)
     else:
         weight_arr = np.asarray(weights, dtype=np.float32)
         if weight_arr.shape[0] != stack.shape[0]:
             raise ValueError("weights length must match masks length")
-        weight_arr = weight_arr[:, None, None]
-        blended = np.sum(stack * weight_arr, axis=0)
+        # Contract the weights against the stack directly; no weighted (F, H, W) product.
+        blended = np.tensordot(weight_arr, stack, axes=1)
         denom = float(weight_arr.sum())
         if denom != 0.0:
             blended /= denom
-    return np.clip(blended, 0.0, 1.0).astype(np.float32)
+    return np.clip(blended, 0.0, 1.0, out=blended)
 
 
 def boolean_stack_to_rgb(
     masks: Mapping[str, np.ndarray],
     palette: Sequence[PaletteEntry],
+    *,
+    out: np.ndarray | None = None,
 ) -> RGBArray:
-    """Map boolean masks to RGB rasters (utilities-rgb anchor)."""
+    """Map boolean masks to RGB rasters (utilities-rgb anchor).
+
+    ``out`` may supply a reusable ``(H, W, 3)`` float32 buffer; it is overwritten.
+    """
 
     if not masks:
         raise ValueError("masks must contain at least one entry")
     height, width = _infer_hw(masks.values())
-    rgb = np.zeros((height, width, 3), dtype=np.float32)
-    for entry in palette:
-        facies = entry.get("facies")
-        if facies is None or facies not in masks:
-            continue
-        mask = _ensure_float(masks[facies])
-        color = np.asarray(_color_to_rgb(entry.get("color")), dtype=np.float32)
-        rgb += mask[..., None] * color
-    return np.clip(rgb, 0.0, 1.0)
+    entries = [entry for entry in palette if entry.get("facies") in masks]
+    stack = np.empty((len(entries), height, width), dtype=np.float32)
+    for idx, entry in enumerate(entries):
+        stack[idx] = masks[entry["facies"]]
+    return stack_to_rgb(stack, palette_colors(entries), out=out)
+
+
+def palette_colors(palette: Sequence[PaletteEntry]) -> NDArray[np.float32]:
+    """Return the ``(F, 3)`` float32 colour table for ``palette`` (utilities-rgb anchor)."""
+
+    return np.array([_color_to_rgb(entry.get("color")) for entry in palette], dtype=np.float32)
+
+
+def stack_to_rgb(
+    stack: np.ndarray,
+    colors: np.ndarray,
+    *,
+    out: np.ndarray | None = None,
+) -> RGBArray:
+    """Composite an ``(F, H, W)`` mask stack with ``(F, 3)`` colours (utilities-rgb anchor).
+
+    Equivalent to summing ``mask[..., None] * color`` per facies and clipping to [0, 1], but
+    the weighted sum runs as one matmul over the stack rather than allocating an
+    ``(H, W, 3)`` temporary per facies. ``out`` behaves as in :func:`boolean_stack_to_rgb`.
+    """
+
+    stack = np.asarray(stack, dtype=np.float32)
+    if stack.ndim != 3:
+        raise ValueError("stack must be FxHxW")
+    count, height, width = stack.shape
+    colors = np.asarray(colors, dtype=np.float32).reshape(count, 3)
+    if out is None:
+        rgb = np.empty((height, width, 3), dtype=np.float32)
+    else:
+        if out.shape != (height, width, 3) or out.dtype != np.float32 or not out.flags.c_contiguous:
+            raise ValueError("out must be a contiguous float32 (H, W, 3) array matching the masks")
+        rgb = out
+    np.matmul(stack.reshape(count, height * width).T, colors, out=rgb.reshape(-1, 3))
+    return np.clip(rgb, 0.0, 1.0, out=rgb)
+
+
+# Deflate level for written PNGs; level 1 encodes several times faster than Pillow's default 6
+# for these smooth fields at a modest size cost.
+PNG_COMPRESS_LEVEL = 1
+
+
+def png_pixels(array: np.ndarray, cmap: str | None = None) -> NDArray[np.uint8]:
+    """Rasterise a ``[0, 1]`` field to uint8 pixels (utilities-rgb anchor).
+
+    Colours match ``plt.imsave(array, cmap=cmap, vmin=0, vmax=1)`` without touching pyplot.
+    A 2-D field with ``cmap`` indexes that colormap's table the way Matplotlib does; maps
+    whose table is pure gray return single-channel ``(H, W)`` pixels. RGB input (or no
+    ``cmap``) is clipped and truncated to 0..255.
+    """
+
+    clipped = _unit_clip(array)
+    if cmap and clipped.ndim == 2:
+        lut = _colormap_lut(cmap)
+        index = np.empty(clipped.shape, dtype=np.intp)
+        np.multiply(clipped, len(lut), out=index, casting="unsafe")
+        np.clip(index, 0, len(lut) - 1, out=index)
+        return lut[index]
+    # Scale straight into the uint8 result; the unsafe cast truncates exactly like astype.
+    pixels = np.empty(clipped.shape, dtype=np.uint8)
+    np.multiply(clipped, 255, out=pixels, casting="unsafe")
+    return pixels
+
+
+def encode_png(pixels: np.ndarray, target: str | Path | IO[bytes]) -> None:
+    """Write uint8 ``pixels`` (``L``/RGB/RGBA by shape) as PNG to a path or buffer."""
+
+    from PIL import Image  # Pillow ships with Matplotlib; imported lazily
+
+    Image.fromarray(pixels).save(target, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
+
+
+def save_png(array: np.ndarray, path: str | Path, *, cmap: str | None = "gray") -> Path:
+    """Rasterise ``array`` with :func:`png_pixels` and write it to ``path`` (utilities-rgb)."""
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    encode_png(png_pixels(array, cmap), path)
+    return path
 
 
 def mask_metadata(mask: np.ndarray) -> dict[str, int | str]:
@@ -215,7 +432,7 @@ def _mask_bool(mask: np.ndarray) -> np.ndarray:
     arr = np.asarray(mask)
     if arr.ndim != 2:
         raise ValueError("mask must be HxW")
-    return arr.astype(bool)
+    return arr.astype(bool, copy=False)  # callers only read it; bool masks pass straight through
 
 
 def _infer_hw(arrays: Iterable[np.ndarray]) -> tuple[int, int]:
@@ -239,16 +456,46 @@ def _color_to_rgb(
     if color is None:
         return (1.0, 1.0, 1.0)
     if isinstance(color, str):
-        value = color.lstrip("#")
-        if len(value) != 6:
-            raise ValueError(f"Unsupported color format: {color}")
-        r = int(value[0:2], 16) / 255.0
-        g = int(value[2:4], 16) / 255.0
-        b = int(value[4:6], 16) / 255.0
-        return (r, g, b)
+        return _hex_to_rgb(color)
     seq = list(color)
     if len(seq) != 3:
         raise ValueError("RGB colors must have three components")
     if max(seq) > 1.0:
         return tuple(float(c) / 255.0 for c in seq)
     return tuple(float(c) for c in seq)
+
+
+_HEX_COLOR_RE = re.compile(r"[0-9a-fA-F]{6}")
+
+
+@lru_cache(maxsize=256)
+def _hex_to_rgb(color: str) -> tuple[float, float, float]:
+    # Palettes reuse a handful of hex strings, so each is decoded once per process. The digit
+    # check keeps int() from accepting "0x", "_" separators or surrounding whitespace.
+    value = color.lstrip("#")
+    if not _HEX_COLOR_RE.fullmatch(value):
+        raise ValueError(f"Unsupported color format: {color}")
+    packed = int(value, 16)
+    return ((packed >> 16) / 255.0, ((packed >> 8) & 0xFF) / 255.0, (packed & 0xFF) / 255.0)
+
+
+def _unit_clip(array: np.ndarray) -> np.ndarray:
+    # Generator fields are normalised already; a min/max scan only reads the array, so the
+    # full-size clipped copy is made only when something is actually out of range (or NaN).
+    arr = np.asarray(array)
+    if arr.size and arr.min() >= 0.0 and arr.max() <= 1.0:
+        return arr
+    return np.clip(arr, 0.0, 1.0)
+
+
+@lru_cache(maxsize=None)
+def _colormap_lut(name: str) -> np.ndarray:
+    # The colormap's own (N, 4) uint8 table; grayscale maps collapse to one (N,) channel.
+    from matplotlib import colormaps  # Lazy: only the registry, not pyplot
+
+    cmap = colormaps[name]
+    lut = cmap(np.arange(cmap.N), bytes=True)
+    if np.all(lut[:, :3] == lut[:, :1]) and np.all(lut[:, 3] == 255):
+        lut = lut[:, 0].copy()
+    lut.setflags(write=False)
+    return lut
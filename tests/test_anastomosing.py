@@ -55,6 +55,14 @@ def test_marsh_fraction_respects_slider():
     assert 0.45 <= ratio <= 0.65
 
 
+def test_make_marsh_threshold_is_exact_on_large_grids():
+    shape = (400, 400)
+    channel = np.zeros(shape, dtype=np.float32)
+    channel[:, 195:205] = 1.0
+    marsh, _, _ = gg.make_marsh(channel, 0.45, np.random.default_rng(1), shape)
+    assert int(marsh.sum()) == round(0.45 * marsh.size)
+
+
 def test_fan_length_validation():
     params = {
         "style": "anastomosing",
@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+
+from analog_image_generator import backend
+
+
+def test_numpy_backend_is_default_and_host_roundtrips():
+    assert backend.active_backend() == "numpy"
+    xp, _, _ = backend.namespaces()
+    assert xp is np
+    array = np.arange(4, dtype=np.float32)
+    assert backend.to_device(array) is array
+    assert isinstance(backend.to_host(array), np.ndarray)
+
+
+def test_set_backend_validates_name_and_availability():
+    with pytest.raises(ValueError):
+        backend.set_backend("torch")
+    if backend.cupy is None:
+        with pytest.raises(RuntimeError):
+            backend.set_backend("cupy")
+        assert backend.active_backend() == "numpy"
@@ -1,9 +1,50 @@
+import importlib.util
 import subprocess
 import sys
 from pathlib import Path
 
+SCRIPT = Path("scripts/validate_geo_anchors.py")
+
+
+def _load_validator():
+    spec = importlib.util.spec_from_file_location("validate_geo_anchors", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
 
 def test_geo_rules_script():
-    script = Path("scripts/validate_geo_anchors.py")
-    result = subprocess.run([sys.executable, str(script)], capture_output=True, text=True)
+    result = subprocess.run([sys.executable, str(SCRIPT)], capture_output=True, text=True)
     assert result.returncode == 0, result.stderr
+
+
+def test_geo_rules_rows_keep_pipes_inside_code_spans(tmp_path, monkeypatch):
+    validator = _load_validator()
+    doc = tmp_path / "GEOLOGIC_RULES.md"
+    doc.write_text(
+        "All | Union | `analog_image_generator.utils.make_field(fill: float | int) -> NDArray`"
+        " | `notebooks/utilities.ipynb#anchor-utilities-blend`\n"
+    )
+    monkeypatch.setattr(validator, "DOC", doc)
+    rows = validator._parse_geo_rows()
+    assert rows == [
+        (
+            ["analog_image_generator.utils.make_field(fill: float | int) -> NDArray"],
+            ["notebooks/utilities.ipynb#anchor-utilities-blend"],
+        )
+    ]
+
+
+def test_notebook_id_cache_treats_malformed_entries_as_misses(tmp_path, monkeypatch):
+    validator = _load_validator()
+    cache_path = tmp_path / "ids.json"
+    monkeypatch.setattr(validator, "CACHE_PATH", cache_path)
+    cache_path.write_text(
+        '{"good": [1, 2, ["a", "b"]], "short": [1], "ids": [1, 2, "ab"], "flag": [true, 2, []]}'
+    )
+    assert validator._read_id_cache() == {"good": (1, 2, {"a", "b"})}
+    for garbage in ("[1, 2]", "not json", ""):
+        cache_path.write_text(garbage)
+        assert validator._read_id_cache() == {}
+    validator._write_id_cache({"nb": (5, 6, {"y", "x"})})
+    assert validator._read_id_cache() == {"nb": (5, 6, {"x", "y"})}
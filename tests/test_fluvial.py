@@ -42,3 +42,25 @@ def test_generate_fluvial_is_deterministic():
             np.testing.assert_allclose(masks_a[key], masks_b[key])
         else:
             assert masks_a[key] == masks_b[key]
+
+
+def test_generator_configs_cast_params_once():
+    cfg = gg.MeanderConfig.from_params({"height": "96", "width": 128.0, "levee_iterations": 4.0})
+    assert (cfg.height, cfg.width, cfg.levee_iterations) == (96, 128, 4)
+    assert gg.MeanderConfig.from_params(cfg) is cfg
+    analog_cfg, _ = gg.generate_meandering(cfg, gg.utils.seeded_rng(2))
+    params = {"height": 96, "width": 128, "levee_iterations": 4}
+    analog_dict, _ = gg.generate_meandering(params, gg.utils.seeded_rng(2))
+    assert np.array_equal(analog_cfg, analog_dict)
+
+
+def test_generate_fluvial_batch_matches_sequential_calls():
+    params_list = [
+        {"height": 96, "width": 96, "seed": 1},
+        {"style": "braided", "height": 96, "width": 96, "seed": 2},
+    ]
+    batch = gg.generate_fluvial_batch(params_list, n_jobs=2)
+    for params, (analog, masks) in zip(params_list, batch):
+        expected_analog, expected_masks = gg.generate_fluvial(params)
+        assert np.array_equal(analog, expected_analog)
+        assert np.array_equal(masks["channel"], expected_masks["channel"])
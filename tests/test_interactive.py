@@ -13,11 +13,27 @@ def test_build_sliders_returns_expected_groups():
     assert meander["default"] == 6
 
 
+def test_interactive_import_defers_ipywidgets():
+    import subprocess
+    import sys
+
+    code = "import sys, analog_image_generator.interactive; print('ipywidgets' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
 def test_build_interactive_ui_constructs_panel():
     panel = interactive.build_interactive_ui("fluvial")
     assert isinstance(panel.layout, ipw.Widget)
     assert "seed" in panel.widgets
     assert panel.widgets["style"].value == "meandering"
+    height = panel.slider_groups["general"]["sliders"]["height"]
+    height["citation_ids"].append("panel-note")
+    assert "panel-note" not in interactive.slider_library("fluvial")["general"]["sliders"][
+        "height"
+    ]["citation_ids"]
 
 
 def test_preview_sequence_returns_layout():
@@ -26,6 +42,26 @@ def test_preview_sequence_returns_layout():
     assert isinstance(result.layout, ipw.Widget)
     assert len(result.frames) == 2
     assert set(result.frames[0]["metrics"].keys()) == {"beta_iso", "fractal_dimension", "entropy_global"}
+    table = result.metrics_soa
+    assert table["seed"].tolist() == [3, 4]
+    assert table["beta_iso"].tolist() == [frame["metrics"]["beta_iso"] for frame in result.frames]
+
+
+def test_preview_sequence_parallel_matches_sequential():
+    params = {"style": "braided", "height": 96, "width": 96}
+    seeds = np.array([5, 6], dtype=np.int64)
+    serial = interactive.preview_sequence("fluvial", params, seeds=seeds)
+    parallel = interactive.preview_sequence("fluvial", params, seeds=seeds, n_jobs=2)
+    assert [f["seed"] for f in parallel.frames] == [5, 6]
+    assert [f["metrics"] for f in parallel.frames] == [f["metrics"] for f in serial.frames]
+
+
+def test_png_bytes_cache_reuses_identical_frames():
+    frame = np.linspace(0.0, 1.0, 64, dtype=np.float32).reshape(8, 8)
+    first = interactive._array_to_png_bytes(frame, cmap="gray")
+    assert interactive._array_to_png_bytes(frame.copy(), cmap="gray") is first
+    assert interactive._array_to_png_bytes(frame, cmap=None) != first
+    assert interactive._array_to_png_bytes(frame[::-1], cmap="gray") != first
 
 
 def test_run_param_batch(tmp_path):
@@ -39,6 +75,62 @@ def test_run_param_batch(tmp_path):
     assert record["color"].exists()
 
 
+def test_run_param_batch_reuses_cached_arrays(tmp_path, monkeypatch):
+    sliders = interactive.build_sliders("fluvial")
+    sliders["general"]["sliders"]["height"]["default"] = 96
+    sliders["general"]["sliders"]["width"]["default"] = 96
+    kwargs = {"seeds": [4], "output_dir": tmp_path, "style": "braided", "cache_arrays": True}
+    first = interactive.run_param_batch("fluvial", sliders, **kwargs)
+    color_bytes = first[0]["color"].read_bytes()
+    assert (tmp_path / "fluvial-braided-004.npz").exists()
+
+    def fail(params):
+        raise AssertionError("cached seed was regenerated")
+
+    monkeypatch.setattr(interactive, "_resolve_generator", lambda env: fail)
+    second = interactive.run_param_batch("fluvial", sliders, **kwargs)
+    assert second[0]["color"].read_bytes() == color_bytes
+    monkeypatch.setattr(interactive, "__version__", "0.0.0+other")
+    with pytest.raises(AssertionError, match="regenerated"):
+        interactive.run_param_batch("fluvial", sliders, **kwargs)
+    monkeypatch.undo()
+    monkeypatch.setattr(interactive, "_resolve_generator", lambda env: fail)
+    sliders["braided"]["sliders"]["thread_count"]["default"] = 3
+    with pytest.raises(AssertionError, match="regenerated"):
+        interactive.run_param_batch("fluvial", sliders, **kwargs)
+
+
+def test_run_param_batch_parallel_writes_same_files(tmp_path):
+    sliders = interactive.build_sliders("fluvial")
+    sliders["general"]["sliders"]["height"]["default"] = 96
+    sliders["general"]["sliders"]["width"]["default"] = 96
+    serial = interactive.run_param_batch(
+        "fluvial", sliders, seeds=[2, 3], output_dir=tmp_path / "serial", style="braided"
+    )
+    parallel = interactive.run_param_batch(
+        "fluvial",
+        sliders,
+        seeds=[2, 3],
+        output_dir=tmp_path / "parallel",
+        style="braided",
+        n_jobs=2,
+    )
+    for one, two in zip(serial, parallel):
+        assert one["seed"] == two["seed"]
+        assert one["color"].read_bytes() == two["color"].read_bytes()
+
+
+def test_extract_slider_defaults_accepts_read_only_library():
+    library = interactive.slider_library("fluvial")
+    defaults = interactive._extract_slider_defaults(library)
+    assert defaults == interactive._extract_slider_defaults(interactive.build_sliders("fluvial"))
+    assert defaults["height"] == 384.0
+    assert interactive._extract_slider_defaults({"seed": 4, "width": {"default": 96}}) == {
+        "seed": 4.0,
+        "width": 96.0,
+    }
+
+
 def test_slider_state_collects_defaults():
     panel = interactive.build_interactive_ui("fluvial")
     state = interactive.slider_state(panel)
@@ -56,6 +148,33 @@ def test_ui_helper_builds_panel():
     assert isinstance(panel["ui"], object)
 
 
+def test_ui_debouncer_coalesces_bursts():
+    import asyncio
+
+    from analog_image_generator import ui
+
+    calls = []
+    debounced = ui._Debouncer(lambda: calls.append(1), 0.01)
+    debounced()
+    assert calls == [1]
+
+    async def burst():
+        for _ in range(5):
+            debounced()
+        await asyncio.sleep(0.05)
+
+    asyncio.run(burst())
+    assert calls == [1, 1]
+
+    async def cancelled():
+        debounced()
+        debounced.cancel()
+        await asyncio.sleep(0.05)
+
+    asyncio.run(cancelled())
+    assert calls == [1, 1]
+
+
 def test_slider_state_collects_defaults():
     panel = interactive.build_interactive_ui("fluvial")
     state = interactive.slider_state(panel)
@@ -63,3 +182,39 @@ def test_slider_state_collects_defaults():
     assert state["height"] > 0
     assert state["width"] > 0
     assert state["seed"] == panel.widgets["seed"].value
+
+
+def test_slider_library_is_shared_and_read_only():
+    library = interactive.slider_library("fluvial")
+    assert library is interactive.slider_library("fluvial")
+    with pytest.raises(TypeError):
+        library["general"]["sliders"]["height"]["default"] = 1
+    editable = interactive.build_sliders("fluvial")
+    editable["general"]["sliders"]["height"]["default"] = 1
+    assert library["general"]["sliders"]["height"]["default"] != 1
+    assert interactive.build_sliders("fluvial")["general"]["sliders"]["height"]["default"] != 1
+    editable["general"]["sliders"]["height"]["citation_ids"].append("local-note")
+    assert "local-note" not in interactive.build_sliders("fluvial")["general"]["sliders"]["height"][
+        "citation_ids"
+    ]
+
+
+def test_ui_preview_cache_reuses_identical_params():
+    from analog_image_generator import ui
+
+    params = {"style": "meandering", "mode": "single", "seed": 3, "height": 96.0, "width": 96.0}
+    first = ui._cached_preview(params)
+    assert ui._cached_preview(dict(params)) is first
+    assert ui._cached_preview({**params, "seed": 4}) is not first
+    stacked = {**params, "mode": "stacked", "package_styles": ["meandering", "braided"]}
+    assert ui._cached_preview(stacked) is ui._cached_preview(dict(stacked))
+    nested = {"a": [1, {"b": [2, 3]}], "c": {"d": 4}}
+    assert ui._preview_key({**params, "extra": nested}) == ui._preview_key(
+        {"extra": {"c": {"d": 4}, "a": [1, {"b": [2, 3]}]}, **params}
+    )
+    assert ui._preview_key({**params, "extra": {1, 2}}) is None
+    as_list = ui._preview_key({**params, "extra": [1, 2]})
+    assert as_list != ui._preview_key({**params, "extra": (1, 2)})
+    assert ui._preview_key({**params, "extra": {"a": 1}}) != ui._preview_key(
+        {**params, "extra": (("a", 1),)}
+    )
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 from analog_image_generator import geologic_generators as gg
 
@@ -56,3 +57,72 @@ def test_petrology_metadata_sums_to_unity():
     }
     metadata = gg._petrology_metadata(masks)
     assert abs(sum(metadata["mineralogy"].values()) - 1.0) <= 1.5e-3
+
+
+@pytest.mark.parametrize(
+    ("marsh", "overbank", "cement", "mud_clasts"),
+    [
+        (0.0, 0.0, "calcite", False),
+        (0.0, 0.5, "calcite", True),
+        (0.5, 0.0, "kaolinite", False),
+        (0.5, 0.5, "kaolinite", True),
+    ],
+)
+def test_petrology_metadata_classes(marsh, overbank, cement, mud_clasts):
+    masks = {
+        "channel_fill": np.full((8, 8), 0.5, dtype=np.float32),
+        "overbank": np.full((8, 8), overbank, dtype=np.float32),
+        "marsh": np.full((8, 8), marsh, dtype=np.float32),
+    }
+    metadata = gg._petrology_metadata(masks)
+    assert metadata["cement_signature"] == cement
+    assert metadata["mud_clasts_bool"] is mud_clasts
+
+
+def test_petrology_metadata_batch_matches_per_sample():
+    rng = gg.utils.seeded_rng(5)
+    stacks = {
+        "channel_fill": rng.random((4, 16, 16)).astype(np.float32),
+        "floodplain": (rng.random((4, 16, 16)) * np.arange(4)[:, None, None] * 0.1).astype(
+            np.float32
+        ),
+        "marsh": (rng.random((4, 16, 16)) * 0.6).astype(np.float32),
+    }
+    batch = gg.petrology_metadata_batch(stacks)
+    for idx in range(4):
+        single = gg._petrology_metadata({key: value[idx] for key, value in stacks.items()})
+        for mineral, fraction in single["mineralogy"].items():
+            assert batch[mineral][idx] == fraction
+        assert batch["cement_signature"][idx] == single["cement_signature"]
+        assert bool(batch["mud_clasts_bool"][idx]) is single["mud_clasts_bool"]
+
+
+def test_petrology_metadata_empty_masks_hit_clip_floor():
+    masks = {"channel_fill": np.zeros((8, 8), dtype=np.float32)}
+    metadata = gg._petrology_metadata(masks)
+    assert metadata["mineralogy"] == {"feldspar": 0.2, "quartz": 0.7, "clay": 0.1}
+
+
+def test_petrology_metadata_accepts_boolean_masks():
+    rng = gg.utils.seeded_rng(8)
+    float_masks = {
+        key: (rng.random((24, 24)) > 0.5).astype(np.float32)
+        for key in ("channel_fill", "overbank", "marsh")
+    }
+    bool_masks = {key: value.astype(bool) for key, value in float_masks.items()}
+    assert gg._petrology_metadata(bool_masks) == gg._petrology_metadata(float_masks)
+    mask = bool_masks["channel_fill"]
+    assert gg._fraction_dtype(mask, 1 << 24) is np.float32
+    assert gg._fraction_dtype(mask, (1 << 24) + 1) is None
+    assert gg._fraction_dtype(float_masks["marsh"], 4) is None
+
+
+def test_sedimentary_overlays_without_channel_still_apply_ripples():
+    gray = np.full((64, 64), 0.5, dtype=np.float32)
+    masks = {"floodplain": np.ones((64, 64), dtype=np.float32)}
+    rng = gg.utils.seeded_rng(3)
+    updated, masks = gg.apply_sedimentary_overlays(gray, masks, rng, "meandering")
+    assert "cross_bed" not in masks
+    assert masks["ripple"].shape == gray.shape
+    assert np.all(gray == 0.5)
+    assert np.all((updated >= 0.0) & (updated <= 1.0))
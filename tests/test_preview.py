@@ -0,0 +1,81 @@
+import json
+
+import numpy as np
+import pytest
+
+from analog_image_generator import preview
+
+
+def test_generate_preview_skips_metadata_payloads():
+    analog, masks, metadata = preview.generate_preview("fluvial", width=96, height=96, seed=3)
+    assert analog.shape == (96, 96)
+    assert "realization_metadata" not in masks
+    assert metadata["mask_names"] == sorted(masks)
+    for mask in masks.values():
+        assert mask.shape == analog.shape
+        assert 0.0 <= float(mask.min()) <= float(mask.max()) <= 1.0
+
+
+def test_generate_preview_without_masks_keeps_names():
+    _, masks, metadata = preview.generate_preview(
+        "fluvial", width=96, height=96, seed=3, generate_masks=False
+    )
+    assert masks == {}
+    assert "channel" in metadata["mask_names"]
+
+
+def test_placeholder_preview_is_normalized():
+    analog, masks, metadata = preview.generate_preview("aeolian", width=32, height=16, seed=1)
+    assert analog.shape == (16, 32)
+    assert masks == {}
+    assert metadata["source"] == "placeholder"
+    assert np.isclose(float(analog.min()), 0.0) and np.isclose(float(analog.max()), 1.0)
+
+
+def test_normalize_array_sanitises_non_finite_values():
+    arr = np.array([[np.nan, 2.0], [4.0, np.inf]], dtype=np.float32)
+    normalized = preview._normalize_array(arr)
+    assert np.isfinite(normalized).all()
+    assert normalized.min() == 0.0 and normalized.max() == 1.0
+    finite = preview._normalize_array(np.array([[1.0, 3.0]]))
+    np.testing.assert_array_equal(finite, [[0.0, 1.0]])
+    assert finite.dtype == np.float32
+
+
+def test_save_preview_quantizes_masks(tmp_path):
+    analog, masks, metadata = preview.generate_preview("fluvial", width=96, height=96, seed=5)
+    artifacts = preview.save_preview(analog, masks, metadata, output_dir=tmp_path, slug="u8")
+    from PIL import Image
+
+    channel = np.asarray(Image.open(artifacts.mask_paths["channel"]))
+    assert channel.dtype == np.uint8
+    assert channel.shape == (96, 96)
+    assert artifacts.analog_path.exists()
+
+
+def test_metadata_json_matches_stdlib_encoder(monkeypatch):
+    pytest.importorskip("orjson")
+    _, _, metadata = preview.generate_preview("fluvial", width=32, height=32, seed=2)
+    payload = {**metadata, "note": "β_iso"}
+    fast = preview._json_bytes(payload)
+    monkeypatch.setattr(preview, "orjson", None)
+    assert preview._json_bytes(payload) == fast
+    assert json.loads(fast) == payload
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_save_preview_encodes_numpy_metadata(tmp_path, monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(preview, "orjson", None)
+    analog, masks, metadata = preview.generate_preview("fluvial", width=32, height=32, seed=2)
+    metadata = {
+        **metadata,
+        "seed": np.int64(2),
+        "params": {"sigma": np.float64(0.35), "flag": np.bool_(True), "lags": np.arange(3)},
+    }
+    artifacts = preview.save_preview(analog, masks, metadata, output_dir=tmp_path, slug="np")
+    written = json.loads(artifacts.metadata_path.read_bytes())
+    assert written["seed"] == 2
+    assert written["params"] == {"sigma": 0.35, "flag": True, "lags": [0, 1, 2]}
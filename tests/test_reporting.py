@@ -1,6 +1,11 @@
+import io
+from dataclasses import fields
 from pathlib import Path
 
 import numpy as np
+import pandas as pd
+from matplotlib.figure import Figure
+from pypdf import PdfReader
 
 from analog_image_generator import reporting
 
@@ -39,3 +44,62 @@ def test_build_reports_creates_files(tmp_path: Path):
     for pdf in artifact_map["env_pdfs"]:
         assert pdf.exists()
     assert artifact_map["master_pdf"].exists()
+
+
+def test_build_reports_accepts_dataclass_rows(tmp_path: Path):
+    names = {f.name for f in fields(reporting.MetricRow)}
+    rows = [
+        reporting.MetricRow(**{k: v for k, v in _sample_row("fluvial", i).items() if k in names})
+        for i in range(2)
+    ]
+    artifact_map = reporting.build_reports(rows, tmp_path)
+    assert artifact_map["csv"].read_text().count("\n") == 3
+    assert artifact_map["master_pdf"].exists()
+
+
+def test_histogram_reuse_matches_fresh_figure():
+    from matplotlib import pyplot as plt
+    from PIL import Image
+
+    def fresh(values, field):
+        buf = io.BytesIO()
+        plt.figure(figsize=(2.5, 2.5))
+        plt.hist(values, bins=10, color="#264653")
+        plt.title(field)
+        plt.tight_layout()
+        plt.savefig(buf, format="png")
+        plt.close()
+        return np.asarray(Image.open(buf))
+
+    rng = np.random.default_rng(4)
+    cases = [(rng.random(30), "beta_iso"), (rng.random(5) * 100.0, "entropy_global"), ([1.0], "h0")]
+    fig = Figure(figsize=(2.5, 2.5))
+    for values, field in cases:
+        frame = pd.DataFrame({field: values})
+        reused = np.asarray(Image.open(reporting._histogram(frame, field, fig)))
+        assert np.array_equal(reused, fresh(values, field))
+    assert reporting._histogram(pd.DataFrame({"beta_iso": [None]}), "beta_iso", fig) is None
+
+
+def test_build_reports_groups_envs_and_skips_missing_mosaics(tmp_path: Path):
+    rows = [_sample_row("fluvial", 0), _sample_row("aeolian", 0), _sample_row("fluvial", 1)]
+    for key in ("gray", "color"):
+        del rows[1][key]
+    artifact_map = reporting.build_reports(rows, tmp_path)
+    assert [pdf.name for pdf in artifact_map["env_pdfs"]] == [
+        "fluvial_report.pdf",
+        "aeolian_report.pdf",
+    ]
+    mosaics = sorted(path.name for path in (tmp_path / "mosaics").iterdir())
+    assert mosaics == ["fluvial_facies.png", "fluvial_gray.png"]
+    assert len(PdfReader(artifact_map["master_pdf"]).pages) == 2
+
+
+def test_build_reports_parallel_matches_serial(tmp_path: Path):
+    rows = [_sample_row(env, i) for env in ("fluvial", "aeolian") for i in range(2)]
+    serial = reporting.build_reports(rows, tmp_path / "serial")
+    parallel = reporting.build_reports(rows, tmp_path / "parallel", n_jobs=2)
+    assert [p.name for p in parallel["env_pdfs"]] == [p.name for p in serial["env_pdfs"]]
+    for serial_pdf, parallel_pdf in zip(serial["env_pdfs"], parallel["env_pdfs"]):
+        expected = PdfReader(serial_pdf).pages[0].extract_text()
+        assert PdfReader(parallel_pdf).pages[0].extract_text() == expected
@@ -81,6 +81,33 @@ def test_generate_fluvial_routes_to_stacked_mode():
     assert meta["stacked_packages"]["stack_statistics"]["package_count"] == 2
 
 
+def test_composite_from_stack_takes_topmost_visible_layer():
+    stack = np.zeros((3, 2, 2), dtype=np.float32)
+    stack[0] = 0.2
+    stack[1, 0] = 0.5
+    stack[2, 0, 0] = 0.9
+    composite, package_map = sc._composite_from_stack(stack, [4, 5, 6])
+    np.testing.assert_allclose(composite, [[0.9, 0.5], [0.2, 0.2]])
+    np.testing.assert_array_equal(package_map, [[6, 5], [4, 4]])
+    stack[0, 1, 1] = 0.0
+    composite, package_map = sc._composite_from_stack(stack, [4, 5, 6])
+    assert composite[1, 1] == 0.0 and package_map[1, 1] == -1
+    assert composite.dtype == np.float32 and package_map.dtype == np.float32
+
+
+def test_cut_erosional_surface_out_trims_top_layer_in_place():
+    rng = np.random.default_rng(3)
+    stack = rng.random((2, 32, 32), dtype=np.float32)
+    trimmed, erosion = sc.cut_erosional_surface(stack, 10.0, "braided")
+    assert trimmed is not stack
+    inplace = stack.copy()
+    result, erosion_inplace = sc.cut_erosional_surface(inplace, 10.0, "braided", out=inplace)
+    assert result is inplace
+    np.testing.assert_array_equal(inplace, trimmed)
+    np.testing.assert_array_equal(erosion_inplace, erosion)
+    np.testing.assert_array_equal(inplace[0], stack[0])
+
+
 def _first_package_ratio(package_map: np.ndarray) -> float:
     depositional = package_map >= 0
     if not np.any(depositional):
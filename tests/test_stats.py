@@ -11,6 +11,36 @@ def test_compute_variogram_monotonic():
     assert np.all(np.diff(iso) >= -1e-5)
 
 
+def test_compute_variogram_matches_direct_lag_means():
+    field = np.random.default_rng(8).random((6, 40), dtype=np.float32)
+    series = stats.compute_variogram(field, {"dir_90": (1, 0), "dir_45": (-1, 1)}, max_lag=9)
+    assert series["dir_90"]["lags"].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+    gamma = [
+        0.5 * np.mean((field[lag:] - field[:-lag]).astype(np.float64) ** 2) for lag in range(1, 6)
+    ]
+    np.testing.assert_allclose(series["dir_90"]["semivariances"], gamma, rtol=1e-5)
+    diag = field[:-2, 2:] - field[2:, :-2]
+    np.testing.assert_allclose(
+        series["dir_45"]["semivariances"][1], 0.5 * np.mean(diag**2), rtol=1e-5
+    )
+    iso = series["isotropic"]
+    assert iso["lags"].dtype == np.float32 and iso["semivariances"].dtype == np.float32
+    assert np.all(np.diff(iso["lags"]) >= 0) and iso["lags"].size == 10
+
+
+def test_entropy_matches_histogram_density():
+    rng = np.random.default_rng(3)
+    field = rng.random((48, 40), dtype=np.float32) * 1.2 - 0.1
+    field[0] = np.arange(40) / 64  # exactly on bin edges
+    field[1, 1] = 1.0  # closed last bin
+    field[2, 2] = np.nan
+    with np.errstate(invalid="ignore"):
+        hist, _ = np.histogram(field, bins=64, range=(0.0, 1.0), density=True)
+    hist = hist[hist > 0]
+    assert stats.entropy(field) == float(-np.sum(hist * np.log2(hist + 1e-12)))
+    assert stats.entropy(np.full((2, 2), np.nan, dtype=np.float32)) == 0.0
+
+
 def test_psd_anisotropy_detects_direction():
     yy = np.linspace(-1, 1, 128, dtype=np.float32)
     xx = np.linspace(-1, 1, 128, dtype=np.float32)
@@ -20,6 +50,32 @@ def test_psd_anisotropy_detects_direction():
     assert metrics["aspect_ratio"] > 1.1
 
 
+def test_psd_anisotropy_half_spectrum_matches_full_fft():
+    rng = np.random.default_rng(9)
+    for shape in ((64, 80), (45, 31), (7, 2)):
+        field = rng.random(shape)
+        centred = field - field.mean()
+        power = np.fft.fftshift(np.abs(np.fft.fft2(centred)) ** 2)
+        yy, xx = np.meshgrid(
+            np.linspace(-0.5, 0.5, shape[0]), np.linspace(-0.5, 0.5, shape[1]), indexing="ij"
+        )
+        weight = power / (power.sum() + 1e-9)
+        m_xx = (weight * xx * xx).sum()
+        m_yy = (weight * yy * yy).sum()
+        m_xy = (weight * xx * yy).sum()
+        theta = 0.5 * np.degrees(np.arctan2(2 * m_xy, m_xx - m_yy + 1e-9))
+        np.testing.assert_allclose(stats.psd_anisotropy(field)["theta_deg"], theta, rtol=1e-4)
+
+
+def test_psd_anisotropy_leaves_input_untouched():
+    field = np.random.default_rng(5).random((33, 48), dtype=np.float32)
+    original = field.copy()
+    metrics = stats.psd_anisotropy(field)
+    np.testing.assert_array_equal(field, original)
+    transposed = stats.psd_anisotropy(field.T)
+    np.testing.assert_allclose(transposed["aspect_ratio"], metrics["aspect_ratio"], rtol=1e-5)
+
+
 def test_compute_metrics_returns_required_keys():
     params = {"style": "meandering", "height": 96, "width": 96, "seed": 12}
     analog, masks = gg.generate_fluvial(params)
@@ -34,3 +90,37 @@ def test_compute_metrics_returns_required_keys():
     }
     assert required.issubset(metrics.keys())
     assert isinstance(metrics["beta_iso"], float)
+
+
+def test_fit_power_law_matches_polyfit():
+    rng = np.random.default_rng(11)
+    lags = np.arange(1, 13, dtype=np.float32)
+    gamma = (0.02 * lags**0.7 * rng.uniform(0.9, 1.1, lags.size)).astype(np.float32)
+    gamma[3] = 0.0  # dropped from the fit like a non-positive lag
+    keep = gamma > 0
+    slope, intercept = np.polyfit(np.log(lags[keep]), np.log(gamma[keep]), 1)
+    np.testing.assert_allclose(stats.fit_power_law(lags, gamma), (slope, intercept), rtol=1e-10)
+    assert stats.fit_power_law(lags[:1], gamma[:1]) == (0.0, 0.0)
+
+
+def test_topology_metrics_binary_masks_match_float_path():
+    rng = np.random.default_rng(4)
+    binary = (rng.random((40, 36)) > 0.6).astype(np.float32)
+    soft = binary * 0.5  # same support, but weighted, so it stays on the float path
+    fast = stats.topology_metrics({"channel": binary})
+    slow = stats.topology_metrics({"channel": soft})
+    assert fast["channel_component_count"] == slow["channel_component_count"]
+    np.testing.assert_allclose(fast["channel_area_fraction"], 2 * slow["channel_area_fraction"])
+    np.testing.assert_allclose(fast["channel_compactness"], slow["channel_compactness"], rtol=1e-6)
+    np.testing.assert_allclose(
+        fast["channel_largest_component_ratio"], slow["channel_largest_component_ratio"], rtol=1e-5
+    )
+    assert fast["levee_area_fraction"] == 0.0 and fast["levee_component_count"] == 0.0
+
+
+def test_two_segment_fit_finds_breakpoint():
+    lags = np.arange(1, 30, dtype=np.float32)
+    gamma = np.where(lags < 8, 0.01 * lags**1.5, 0.01 * 8**1.5 * (lags / 8) ** 0.3)
+    seg = stats.two_segment_fit(lags, gamma.astype(np.float32))
+    fitted = [seg["beta_seg1"], seg["beta_seg2"], seg["h0"]]
+    np.testing.assert_allclose(fitted, [1.5, 0.3, 8.0], rtol=1e-4)
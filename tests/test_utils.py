@@ -1,5 +1,6 @@
 import numpy as np
 import pytest
+from scipy import ndimage
 
 from analog_image_generator import utils
 
@@ -36,6 +37,55 @@ def test_distance_helpers_behave():
     assert signed[0, 0] > 0.0
 
 
+def test_distance_helpers_match_exact_edt():
+    yy, xx = np.mgrid[:90, :110]
+    mask = (np.sin(xx / 7.0) + np.cos(yy / 5.0)) > 0.8
+    expected = ndimage.distance_transform_edt(~mask).astype(np.float32)
+    for _ in range(4):  # repeated calls must agree bit for bit
+        np.testing.assert_array_equal(utils.distance_to_mask(mask), expected)
+    signed = utils.signed_distance(mask)
+    inside = ndimage.distance_transform_edt(mask).astype(np.float32)
+    np.testing.assert_array_equal(signed, np.where(mask, -inside, expected))
+
+
+def test_distance_to_mask_batch_matches_single_calls():
+    rng = np.random.default_rng(6)
+    masks = [rng.random((40, 50)) > p for p in (0.9, 0.97, 0.995)]
+    for workers in (1, 3):
+        batch = utils.distance_to_mask_batch(masks, max_workers=workers)
+        for mask, dist in zip(masks, batch):
+            np.testing.assert_array_equal(dist, utils.distance_to_mask(mask))
+    assert utils.distance_to_mask_batch([]) == []
+
+
+def test_noise_bank_matches_periodic_gaussian_filter():
+    bank = utils.noise_bank((24, 30), utils.seeded_rng(5), (0.0, 3.0))
+    assert bank.shape == (2, 24, 30)
+    assert bank.dtype == np.float32
+    white = utils.seeded_rng(5).standard_normal((24, 30), dtype=np.float32)
+    assert np.array_equal(bank[0], white)
+    expected = ndimage.gaussian_filter(white, sigma=3.0, mode="wrap")
+    assert np.allclose(bank[1], expected, atol=1e-4)
+
+
+def test_sample_sums_reduces_trailing_axes():
+    stack = utils.seeded_rng(4).random((3, 6, 7), dtype=np.float32)
+    sums = utils.sample_sums(stack)
+    assert sums.shape == (3,)
+    assert np.allclose(sums, stack.sum(axis=(1, 2)), rtol=1e-6)
+    counts = utils.sample_sums(stack > 0.5, dtype=np.float32)
+    assert counts.dtype == np.float32
+    assert np.array_equal(counts, (stack > 0.5).sum(axis=(1, 2)).astype(np.float32))
+
+
+def test_gaussian_blur_matches_ndimage_in_place():
+    field = utils.seeded_rng(9).random((20, 25), dtype=np.float32)
+    expected = ndimage.gaussian_filter(field, sigma=2.0)
+    blurred = utils.gaussian_blur(field, 2.0, out=field)
+    assert blurred is field
+    assert np.allclose(blurred, expected, atol=1e-5)
+
+
 def test_blend_masks_weighted():
     m1 = np.zeros((2, 2), dtype=np.float32)
     m2 = np.ones((2, 2), dtype=np.float32)
@@ -43,6 +93,10 @@ def test_blend_masks_weighted():
     assert blended.min() >= 0.0
     assert blended.max() <= 1.0
     assert blended[0, 0] == pytest.approx(0.75)
+    averaged = utils.blend_masks([m1.astype(bool), m2.astype(bool)])
+    assert np.array_equal(averaged, np.full((2, 2), 0.5))
+    with pytest.raises(ValueError):
+        utils.blend_masks([m1, np.ones((3, 2))])
 
 
 def test_boolean_stack_to_rgb_and_metadata():
@@ -53,10 +107,50 @@ def test_boolean_stack_to_rgb_and_metadata():
     palette = utils.palette_for_env("fluvial")
     rgb = utils.boolean_stack_to_rgb(masks, palette)
     assert rgb.shape == (2, 2, 3)
+    buffer = np.full((2, 2, 3), 9.0, dtype=np.float32)
+    reused = utils.boolean_stack_to_rgb(masks, palette, out=buffer)
+    assert reused is buffer
+    assert np.array_equal(reused, rgb)
     metadata = utils.mask_metadata(masks["channel"])
     assert metadata == {"dtype": "float32", "height": 2, "width": 2}
 
 
+def test_stack_to_rgb_matches_per_facies_sum():
+    rng = utils.seeded_rng(12)
+    stack = rng.random((3, 5, 6), dtype=np.float32)
+    colors = rng.random((3, 3), dtype=np.float32)
+    expected = np.clip(sum(stack[i][..., None] * colors[i] for i in range(3)), 0.0, 1.0)
+    assert np.allclose(utils.stack_to_rgb(stack, colors), expected, atol=1e-6)
+    blank = utils.stack_to_rgb(np.empty((0, 5, 6), dtype=np.float32), np.empty((0, 3)))
+    assert blank.shape == (5, 6, 3)
+    assert not blank.any()
+
+
+def test_save_png_matches_matplotlib_imsave(tmp_path):
+    from matplotlib import pyplot as plt
+    from PIL import Image
+
+    rng = utils.seeded_rng(5)
+    field = rng.random((7, 9)).astype(np.float32)
+    field[0, 0] = 1.4  # clipped like vmax=1
+    rgb = rng.random((7, 9, 3)).astype(np.float32)
+    for array, cmap in ((field, "gray"), (field, "viridis"), (rgb, None)):
+        reference = tmp_path / "reference.png"
+        plt.imsave(reference, np.clip(array, 0.0, 1.0), cmap=cmap, vmin=0.0, vmax=1.0)
+        written = utils.save_png(array, tmp_path / "nested" / "out.png", cmap=cmap)
+        expected = np.asarray(Image.open(reference).convert("RGB"))
+        assert np.array_equal(np.asarray(Image.open(written).convert("RGB")), expected)
+    assert Image.open(utils.save_png(field, tmp_path / "gray.png")).mode == "L"
+
+
 def test_palette_for_env_unknown():
     with pytest.raises(ValueError):
         utils.palette_for_env("unknown")
+
+
+def test_palette_colors_reject_malformed_hex():
+    expected = np.array([[1.0, 128 / 255, 0.0]], dtype=np.float32)
+    assert np.array_equal(utils.palette_colors([{"color": "#FF8000"}]), expected)
+    for color in ("0x1234", "12_345", " 12345", "#12345 ", "#ggg000", "#fff"):
+        with pytest.raises(ValueError):
+            utils.palette_colors([{"color": color}])